@@ -1,9 +1,27 @@
 # setup.py
+import importlib
+import sys
 from setuptools import setup, find_packages
 from pathlib import Path
 
+# Emit console scripts that import the entry point directly instead of going
+# through pkg_resources. Not importable under PEP 517 isolated builds, where
+# wheels already get direct-import launchers.
+try:
+    # Imported only for its side effect: it patches setuptools' script writer
+    importlib.import_module('fastentrypoints')
+except ImportError:
+    pass
+
 this_directory = Path(__file__).parent
-long_description = (this_directory / "README.md").read_text(encoding='utf-8')
+
+# Only commands that publish package metadata need the long description;
+# editable installs and metadata queries skip reading README.md.
+PUBLISH_COMMANDS = {"sdist", "bdist_wheel"}
+if PUBLISH_COMMANDS.intersection(sys.argv[1:]):
+    long_description = (this_directory / "README.md").read_text(encoding='utf-8')
+else:
+    long_description = ""
 
 # Core dependencies
 INSTALL_REQUIRES = [
@@ -15,7 +33,17 @@ INSTALL_REQUIRES = [
     "schedule>=1.1.0",
     "tqdm>=4.65.0",
     "requests>=2.28.0",
-    "pyyaml>=6.0.1",
+    "pyyaml>=6.0.1",  # binary wheels bundle libyaml (CSafeLoader)
+]
+
+# Optional faster checksums (--checksum-algorithm blake3)
+CHECKSUM_REQUIRES = [
+    "blake3>=0.3.0",
+]
+
+# Optional faster ffprobe JSON parsing
+SPEEDUPS_REQUIRES = [
+    "orjson>=3.0",
 ]
 
 # Development dependencies
@@ -23,6 +51,7 @@ DEV_REQUIRES = [
     "pytest>=7.3.1",
     "pytest-cov>=4.0.0",
     "pytest-mock>=3.10.0",
+    "pytest-xdist>=3.0.0",
     "responses>=0.23.1",
 ]
 
@@ -58,6 +87,8 @@ setup(
         "dev": DEV_REQUIRES,
         "lint": LINT_REQUIRES,
         "docs": DOCS_REQUIRES,
+        "checksum": CHECKSUM_REQUIRES,
+        "speedups": SPEEDUPS_REQUIRES,
         # Combine all development dependencies
         "all": DEV_REQUIRES + LINT_REQUIRES + DOCS_REQUIRES,
     },
@@ -0,0 +1,32 @@
+# src/video_dl/__init__.py
+"""Video-DL: advanced video and subtitle downloader."""
+import importlib
+from typing import Any, List
+
+# Public names resolved on first access so that importing the package (and
+# therefore every CLI entry point) doesn't pull in the core modules.
+_LAZY_ATTRS = {
+    'VideoDownloader': 'video_dl.core.downloader',
+    'VideoProcessor': 'video_dl.core.processor',
+    'SubtitleDownloader': 'video_dl.core.subtitle',
+    'DownloadConfig': 'video_dl.models.config',
+    'ProcessingConfig': 'video_dl.models.config',
+    'SubtitleConfig': 'video_dl.models.config',
+    'DownloadResult': 'video_dl.models.video',
+    'VideoMetadata': 'video_dl.models.video',
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
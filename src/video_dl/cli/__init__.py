@@ -0,0 +1,13 @@
+# src/video_dl/cli/__init__.py
+"""Command line entry points."""
+import importlib
+from types import ModuleType
+
+# Each entry point only loads its own command module.
+__all__ = ['download', 'subtitle']
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f"{__name__}.{name}")
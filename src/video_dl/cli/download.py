@@ -1,20 +1,32 @@
 # src/video_dl/cli/download.py
 import click
+from dataclasses import fields
 from pathlib import Path
 
 from video_dl.exceptions.errors import UnsupportedPlatformError
 from ..models.config import DownloadConfig, ProcessingConfig
 from ..core.downloader import VideoDownloader
-from ..logging.logger import get_logger
 from ..utils.validation import validate_url
 
-logger = get_logger(__name__)
+_HELP_OPTIONS = ['-h', '--help']
 
-@click.group()
+# Click option names that map one-to-one onto config dataclass fields
+_PROCESSING_FIELDS = frozenset(f.name for f in fields(ProcessingConfig))
+_DOWNLOAD_FIELDS = frozenset(f.name for f in fields(DownloadConfig)) - {'url', 'output_path', 'processing'}
+
+_ROTATIONS = (0, 90, 180, 270)
+
+@click.group(context_settings={'help_option_names': _HELP_OPTIONS})
 def cli():
     """Video Downloader CLI"""
     pass
 
+def _validate_rotation(ctx, param, value):
+    """Reject unsupported rotations before anything is downloaded."""
+    if value is not None and value not in _ROTATIONS:
+        raise click.BadParameter(f"must be one of {', '.join(map(str, _ROTATIONS))}")
+    return value
+
 @cli.command()
 @click.argument('url')
 @click.option('-o', '--output', type=click.Path(), default='downloads',
@@ -27,13 +39,16 @@ def cli():
 @click.option('--limit-speed', help='Download speed limit (e.g., 1M, 500K)')
 @click.option('--username', help='Account username')
 @click.option('--password', help='Account password')
+@click.option('--fragment-workers', type=click.IntRange(min=1), default=8,
+              help='Parallel fragment downloads for HLS/DASH streams')
 @click.option('--cookies_file', type=click.Path(exists=True),
               help='Path to cookies file')
 @click.option('--process/--no-process', default=False,
               help='Enable video processing')
 @click.option('--crop', help='Crop video (width:height:x:y)')
 @click.option('--resize', help='Resize video (widthxheight)')
-@click.option('--rotate', type=int, help='Rotate video (degrees)')
+@click.option('--rotate', type=int, callback=_validate_rotation,
+              help='Rotate video (0, 90, 180 or 270 degrees)')
 @click.option('--fps', type=int, help='Target FPS')
 @click.option('--remove-audio/--keep-audio', default=False,
               help='Remove audio track')
@@ -45,6 +60,12 @@ def cli():
 @click.option('--audio-codec', help='Audio codec (e.g., aac, mp3)')
 @click.option('--video-bitrate', help='Video bitrate (e.g., 5M)')
 @click.option('--audio-bitrate', help='Audio bitrate (e.g., 192k)')
+@click.option('--hw-accel', type=click.Choice(['cuda', 'qsv', 'videotoolbox']),
+              help='Hardware decoding/encoding backend')
+@click.option('--checksum/--no-checksum', 'compute_checksum', default=False,
+              help='Compute a checksum of the downloaded file')
+@click.option('--checksum-algorithm', type=click.Choice(['sha256', 'blake3']),
+              default='sha256', help='Checksum algorithm (blake3 needs the blake3 package)')
 
 def download(url, **kwargs):
     """Download video from URL"""
@@ -53,35 +74,19 @@ def download(url, **kwargs):
             raise click.BadParameter(f"Invalid URL: {url}")
 
         # Prepare ProcessingConfig if processing is enabled
-        process_enabled = kwargs.pop('process', False)
+        process_enabled = kwargs['process']
         processing_config = None
         if process_enabled:
             processing_config = ProcessingConfig(
-                crop=kwargs.pop('crop', None),
-                resize=kwargs.pop('resize', None),
-                rotate=kwargs.pop('rotate', None),
-                fps=kwargs.pop('fps', None),
-                remove_audio=kwargs.pop('remove_audio', False),
-                extract_audio=kwargs.pop('extract_audio', False),
-                audio_format=kwargs.pop('audio_format', 'mp3'),
-                video_codec=kwargs.pop('video_codec', 'libx264'),
-                audio_codec=kwargs.pop('audio_codec', 'aac'),
-                video_bitrate=kwargs.pop('video_bitrate', None),
-                audio_bitrate=kwargs.pop('audio_bitrate', None)
+                **{k: v for k, v in kwargs.items() if k in _PROCESSING_FIELDS}
             )
 
         # Prepare main config
         config = DownloadConfig(
             url=url,
-            output_path=Path(kwargs.pop('output', 'downloads')),
-            quality=kwargs.pop('quality', 'best'),
-            format_id=kwargs.pop('format_id', None),
+            output_path=Path(kwargs['output']),
             processing=processing_config,
-            proxy=kwargs.pop('proxy', None),
-            limit_speed=kwargs.pop('limit_speed', None),
-            username=kwargs.pop('username', None),
-            password=kwargs.pop('password', None),
-            cookies_file=kwargs.pop('cookies_file', None)
+            **{k: v for k, v in kwargs.items() if k in _DOWNLOAD_FIELDS}
         )
 
         # Initialize and run downloader
@@ -108,6 +113,8 @@ def download(url, **kwargs):
             ))
             click.echo(f"Download time: {result.download_time:.1f}s")
             click.echo(f"File size: {result.filesize / 1024 / 1024:.1f}MB")
+            if config.compute_checksum:
+                click.echo(f"{result.checksum_algorithm.upper()}: {result.checksum}")
         else:
             if isinstance(result.error, UnsupportedPlatformError):
                 click.echo(click.style(
@@ -125,4 +132,4 @@ def download(url, **kwargs):
         raise click.Abort()
 
 def main():
-    cli()
\ No newline at end of file
+    cli()
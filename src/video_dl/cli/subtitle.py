@@ -3,11 +3,10 @@ import click
 from pathlib import Path
 from ..models.config import SubtitleConfig
 from ..core.subtitle import SubtitleDownloader
-from ..logging.logger import get_logger
 
-logger = get_logger(__name__)
+_HELP_OPTIONS = ['-h', '--help']
 
-@click.group()
+@click.group(context_settings={'help_option_names': _HELP_OPTIONS})
 def cli():
     """Subtitle Downloader CLI"""
     pass
@@ -33,12 +32,13 @@ def download(url, **kwargs):
     try:
         config = SubtitleConfig(
             url=url,
-            output_path=Path(kwargs.pop('output')),
-            languages=kwargs.pop('languages').split(','),
-            formats=kwargs.pop('formats').split(','),
-            convert_to_srt=kwargs.pop('convert_srt'),
-            fix_encoding=kwargs.pop('fix_encoding', True),
-            merge_subtitles=kwargs.pop('merge', False)
+            output_path=Path(kwargs['output']),
+            languages=kwargs['languages'].split(','),
+            formats=kwargs['formats'].split(','),
+            auto_generated=kwargs['auto_generated'],
+            convert_to_srt=kwargs['convert_srt'],
+            fix_encoding=kwargs['fix_encoding'],
+            merge_subtitles=kwargs['merge']
         )
 
         downloader = SubtitleDownloader(config)
@@ -62,4 +62,4 @@ def download(url, **kwargs):
         raise click.Abort()
     
 def main():
-    cli()
\ No newline at end of file
+    cli()
@@ -1,23 +1,74 @@
 # src/video_dl/config/settings.py
+from collections.abc import Mapping
+from functools import cached_property
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, Optional
-import yaml
 import os
 import logging.config
 
+CONFIG_DIR = Path.home() / '.config' / 'video-dl'
+DOWNLOAD_DIR = Path.home() / 'Downloads' / 'video-dl'
+TEMP_DIR = Path.home() / '.cache' / 'video-dl'
+
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only view of nested dicts and lists."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Return a mutable copy of a structure produced by _freeze."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+# Built once; each Settings gets a mutable copy from _thaw.
+_DEFAULT_CONFIG = _freeze({
+    'download': {
+        'output_dir': str(DOWNLOAD_DIR),
+        'temp_dir': str(TEMP_DIR),
+        'max_concurrent_downloads': 3,
+        'default_quality': '1080p',
+        'rate_limit': None,
+        'proxy': None
+    },
+    'processing': {
+        'video_codec': 'libx264',
+        'audio_codec': 'aac',
+        'thumbnail_size': '1280x720',
+        'max_processing_threads': 2
+    },
+    'subtitles': {
+        'languages': ['en'],
+        'download_auto': False,
+        'convert_to_srt': True
+    },
+    'storage': {
+        'max_temp_size': '10GB',
+        'cleanup_after_days': 7,
+        'min_free_space': '5GB'
+    }
+})
+
+
+def _ensure_dir(path: Path) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 class Settings:
     """Global application settings."""
 
     def __init__(self, config_file: Optional[Path] = None):
-        self.config_dir = Path.home() / '.config' / 'video-dl'
-        self.config_file = config_file if config_file else self.config_dir / 'config.yaml'
-        self.download_dir = Path.home() / 'Downloads' / 'video-dl'
-        self.temp_dir = Path.home() / '.cache' / 'video-dl'
-        self.log_dir = self.config_dir / 'logs'
-
-        # Create necessary directories
-        for directory in [self.config_dir, self.download_dir, self.temp_dir, self.log_dir]:
-            directory.mkdir(parents=True, exist_ok=True)
+        self.config_file = config_file if config_file else CONFIG_DIR / 'config.yaml'
 
         # Load configuration
         self.config = self._load_config()
@@ -25,59 +76,53 @@ class Settings:
         # Setup logging
         self._setup_logging()
 
-    
-    def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from file."""
-        default_config = {
-            'download': {
-                'output_dir': str(self.download_dir),
-                'temp_dir': str(self.temp_dir),
-                'max_concurrent_downloads': 3,
-                'default_quality': '1080p',
-                'rate_limit': None,
-                'proxy': None
-            },
-            'processing': {
-                'video_codec': 'libx264',
-                'audio_codec': 'aac',
-                'thumbnail_size': '1280x720',
-                'max_processing_threads': 2
-            },
-            'subtitles': {
-                'languages': ['en'],
-                'download_auto': False,
-                'convert_to_srt': True
-            },
-            'storage': {
-                'max_temp_size': '10GB',
-                'cleanup_after_days': 7,
-                'min_free_space': '5GB'
-            }
-        }
+    # Directories are created on first use rather than on every startup.
+    @cached_property
+    def config_dir(self) -> Path:
+        return _ensure_dir(CONFIG_DIR)
+
+    @cached_property
+    def download_dir(self) -> Path:
+        return _ensure_dir(DOWNLOAD_DIR)
 
+    @cached_property
+    def temp_dir(self) -> Path:
+        return _ensure_dir(TEMP_DIR)
+
+    @cached_property
+    def log_dir(self) -> Path:
+        return _ensure_dir(CONFIG_DIR / 'logs')
+
+    def _load_config(self) -> Dict:
+        """Load configuration from file, falling back to the defaults."""
         try:
             if self.config_file.exists():
-                print(f"Loading config from: {self.config_file}")  # Add path check
+                import yaml
+                # Prefer the libyaml-backed loader when PyYAML was built with it
+                loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
                 with open(self.config_file) as f:
-                    user_config = yaml.safe_load(f)
+                    user_config = yaml.load(f, Loader=loader)
                     # Deep merge user config with defaults
-                    merged_config = self._merge_configs(default_config, user_config or {})
-                    print(f"Loaded and merged config: {merged_config}")  # Log loaded config
-                    return merged_config
+                    return self._merge_configs(_DEFAULT_CONFIG, user_config or {})
         except Exception as e:
             logging.error(f"Failed to load config: {str(e)}")
 
-        return default_config
+        return _thaw(_DEFAULT_CONFIG)
 
     def _merge_configs(self, default: Dict, user: Dict) -> Dict:
         """Deep merge two configuration dictionaries."""
-        result = default.copy()
-        for key, value in user.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
-        print(f"Merging result: {result}")  # Debug to check merging process
+        # _thaw gives a fresh mutable copy, so sections can be updated in place.
+        result = _thaw(default)
+        # Walk nested sections with an explicit stack of (target, overrides) pairs.
+        stack = [(result, user)]
+        while stack:
+            target, overrides = stack.pop()
+            for key, value in overrides.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
         return result
     
     def _setup_logging(self) -> None:
@@ -96,6 +141,7 @@ class Settings:
                     'filename': str(self.log_dir / 'video-dl.log'),
                     'maxBytes': 10485760,  # 10MB
                     'backupCount': 5,
+                    'delay': True,  # Open the log file on the first record, not at setup
                     'formatter': 'standard',
                 },
                 'console': {
@@ -131,14 +177,29 @@ class Settings:
     def save(self) -> None:
         """Save current configuration to file."""
         try:
-            print(f"Saving config to: {self.config_file}")  # Add path check
+            import yaml
+            dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+            self.config_file.parent.mkdir(parents=True, exist_ok=True)
             with open(self.config_file, 'w') as f:
-                yaml.safe_dump(self.config, f, default_flow_style=False)
-            print(f"Config saved: {self.config}")  # Confirm save
+                yaml.dump(self.config, f, Dumper=dumper, default_flow_style=False)
         except Exception as e:
             logging.error(f"Failed to save config: {str(e)}")
 
 
+_settings: Optional[Settings] = None
+
+
+def get_settings() -> Settings:
+    """Return the global settings instance, creating it on first use."""
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
+
 
-# Global settings instance
-settings = Settings()
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    # Keep ``from video_dl.config.settings import settings`` working without
+    # loading configuration at import time.
+    if name == 'settings':
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
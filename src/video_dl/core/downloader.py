@@ -1,84 +1,127 @@
 # src/video_dl/core/downloader.py
+import copy
+import dataclasses
+import os
+import random
 import re
+import shutil
+import sys
+import threading
 import time
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional
 from pathlib import Path
-from urllib.parse import urlparse
-import yt_dlp
 from ..models.config import DownloadConfig
 from ..models.video import DownloadResult, VideoMetadata
 from ..exceptions.errors import DownloadError, UnsupportedPlatformError, ValidationError
-from ..utils.filesystem import calculate_checksum
+from ..utils.filesystem import IncrementalChecksum, calculate_checksum
 from ..logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+# http(s) scheme, a host, then a path, query or fragment
+_URL_RE = re.compile(r'^(?i:https?)://[^\s/?#]+[/?#]\S*$')
+_MAX_URL_LENGTH = 2083  # Common URL length limit
+_SIZE_RE = re.compile(r'^([\d.]+)([KMG])?$')
+_UNIT_SHIFTS = {'K': 10, 'M': 20, 'G': 30}
+_PROGRESS_INTERVAL = 0.1  # Seconds between progress line updates
+_MAX_RETRY_DELAY = 5.0  # Seconds
+# Errors that will fail the same way on every attempt (matched lowercased)
+_PERMANENT_ERRORS = ('http error 404', 'http error 410', 'private video', 'video unavailable')
+# Signed media URLs in the extracted info have expired; extract again
+_STALE_INFO_ERRORS = ('http error 403',)
+# Keeps progress lines from concurrent downloads from interleaving
+_OUTPUT_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=16)
+def _format_spec(quality: str) -> str:
+    """Build the yt-dlp format selector for a quality setting."""
+    if quality == 'best':
+        return 'bestvideo[ext=mp4][vcodec^=avc]+bestaudio[ext=m4a]/best[ext=mp4][vcodec^=avc]/best'
+    # Extract numeric height from quality string (e.g., '1080p' -> '1080')
+    height = quality.rstrip('p')
+    return f'bestvideo[height<={height}][ext=mp4][vcodec^=avc]+bestaudio[ext=m4a]/best[height<={height}][ext=mp4][vcodec^=avc]/best'
+
+
+@lru_cache(maxsize=64)
+def _parse_size(size_str: str) -> int:
+    """Parse a size like '1M' or '500K' to bytes; batch configs repeat the same few."""
+    # Remove whitespace and convert to uppercase for consistency
+    size_str = size_str.strip().upper()
+    
+    # Parse value and unit
+    match = _SIZE_RE.match(size_str)
+    if not match:
+        raise ValidationError(f"Invalid size format: {size_str}")
+    
+    value, unit = match.groups()
+    try:
+        value = float(value)
+    except ValueError:
+        raise ValidationError(f"Invalid numeric value: {value}")
+        
+    # Convert to bytes (units are powers of 1024)
+    shift = _UNIT_SHIFTS.get(unit, 0)
+    if value.is_integer():
+        return int(value) << shift
+    return int(value * (1 << shift))
+
+
+@lru_cache(maxsize=1)
+def _aria2c_available() -> bool:
+    return shutil.which('aria2c') is not None
+
+
 class VideoDownloader:
-    def __init__(self, config: DownloadConfig):
+    def __init__(self, config: DownloadConfig, label: Optional[str] = None):
         self.config = config
+        # Prefix for progress output when several downloads run at once
+        self._label = label
+        self._last_progress_time = 0.0
         self._validate_url(self.config.url)
         self.ydl_opts = self._prepare_ydl_opts()
+        # Checksums are computed while yt-dlp writes the file; digests of
+        # finished files are kept by filename until download() picks them up.
+        # A format with '+' may download separate parts that are merged into
+        # a new file, which download() hashes, so parts are not hashed.
+        self._hash_lock = threading.Lock()
+        incremental = config.compute_checksum and '+' not in self.ydl_opts['format']
+        self._partial_hash = IncrementalChecksum(config.checksum_algorithm) if incremental else None
+        self._checksums: Dict[str, str] = {}
 
     def _validate_url(self, url: str) -> None:
         """Validate URL format."""
         if not url or not isinstance(url, str):
             raise ValidationError("URL cannot be empty")
-        
-        try:
-            result = urlparse(url)
-            if not all([
-                result.scheme in ('http', 'https'),
-                result.netloc,  # Must have a domain
-                result.path or result.query or result.fragment, # Ensures URL has path, query, or fragment
-                len(url) <= 2083  # Common URL length limit
-            ]):
-                raise ValidationError(f"Invalid URL format: {url}")
-        except Exception:
+
+        if len(url) > _MAX_URL_LENGTH or not _URL_RE.match(url):
             raise ValidationError(f"Invalid URL format: {url}")
-    
+
     def _parse_size_string(self, size_str: str) -> int:
         """Parse size string with units (e.g., '1M', '500K') to bytes."""
-        units = {
-            'K': 1024,
-            'M': 1024 * 1024,
-            'G': 1024 * 1024 * 1024
-        }
-        
-        # Remove whitespace and convert to uppercase for consistency
-        size_str = size_str.strip().upper()
-        
-        # Parse value and unit
-        match = re.match(r'^([\d.]+)([KMG])?$', size_str)
-        if not match:
-            raise ValidationError(f"Invalid size format: {size_str}")
-        
-        value, unit = match.groups()
-        try:
-            value = float(value)
-        except ValueError:
-            raise ValidationError(f"Invalid numeric value: {value}")
-            
-        # Convert to bytes
-        return int(value * (units.get(unit, 1) if unit else 1))
+        return _parse_size(size_str)
 
     def _prepare_ydl_opts(self) -> Dict:
         """Prepare yt-dlp options from configuration."""
-        # Handle quality setting
-        if self.config.quality == 'best':
-            format_spec = 'bestvideo[ext=mp4][vcodec^=avc]+bestaudio[ext=m4a]/best[ext=mp4][vcodec^=avc]/best'
-        else:
-            # Extract numeric height from quality string (e.g., '1080p' -> '1080')
-            height = self.config.quality.rstrip('p')
-            format_spec = f'bestvideo[height<={height}][ext=mp4][vcodec^=avc]+bestaudio[ext=m4a]/best[height<={height}][ext=mp4][vcodec^=avc]/best'
-
         opts = {
-            'format': self.config.format_id or format_spec,
+            'format': self.config.format_id or _format_spec(self.config.quality),
             'outtmpl': str(self.config.output_path / '%(title)s.%(ext)s'),
             'retries': getattr(self.config, 'retries', 3),
             'quiet': False,
             'progress_hooks': [self._progress_hook],
             'merge_output_format': 'mp4',
+            # Fetch HLS/DASH fragments in parallel
+            'concurrent_fragment_downloads': self.config.fragment_workers,
         }
+
+        if _aria2c_available():
+            # aria2c splits segmented streams across many connections
+            opts['external_downloader'] = {'m3u8': 'aria2c', 'dash': 'aria2c'}
+            opts['external_downloader_args'] = {
+                'aria2c': ['-x', '16', '-s', '16', '--min-split-size=1M', '--file-allocation=none']
+            }
         
         if self.config.proxy:
             opts['proxy'] = self.config.proxy
@@ -91,26 +134,31 @@ class VideoDownloader:
         
         return opts
     
-    def _parse_quality(self, quality: str) -> str:
-        """Parse quality string to determine video resolution limit."""
-        if isinstance(quality, str):
-            match = re.match(r'(\d+)', quality)
-            if match:
-                return match.group(1)  # Extracts the numeric part, like 720 from "720p"
-        return 'best'  # Default to "best" if no resolution is specified
-
     def download(self) -> DownloadResult:
         """Download video from URL."""
+        import yt_dlp
+
         url = self.config.url
         start_time = time.time()
         last_error = None
+        info = None
 
-        for attempt in range(self.config.retries):
-            try:
-                with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
+        # One YoutubeDL instance serves every attempt; building it registers
+        # all extractors, which is wasted work to repeat on a transient error.
+        with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
+            for attempt in range(self.config.retries):
+                try:
                     try:
-                        # Get info and download in one call
-                        info = ydl.extract_info(url, download=True)
+                        # Extraction (page, player JS, signatures) is kept
+                        # across attempts; a retry only redoes the download.
+                        if info is None:
+                            info = ydl.extract_info(url, download=False)
+                            attempt_info = info
+                        else:
+                            # yt-dlp updates the dict it is given; each retry
+                            # works on its own copy of the extracted info
+                            attempt_info = copy.deepcopy(info)
+                        result = ydl.process_ie_result(attempt_info, download=True)
                     except yt_dlp.utils.UnsupportedError:
                         raise UnsupportedPlatformError(f"Platform not supported for URL: {url}")
                     except yt_dlp.utils.DownloadError as e:
@@ -118,47 +166,65 @@ class VideoDownloader:
                             raise UnsupportedPlatformError(f"Platform not supported for URL: {url}")
                         raise
 
-                    filename = ydl.prepare_filename(info)
-                    filepath = Path(filename)
-
-                    if not filepath.exists():
-                        raise DownloadError(f"Download completed but file not found: {filepath}")
+                    filename = ydl.prepare_filename(result)
+                    try:
+                        filesize = os.path.getsize(filename)
+                    except FileNotFoundError:
+                        raise DownloadError(f"Download completed but file not found: {filename}")
 
                     metadata = self._extract_metadata(info)
-                    filesize = filepath.stat().st_size
-                    checksum = calculate_checksum(filepath)
+                    checksum = None
+                    if self.config.compute_checksum:
+                        with self._hash_lock:
+                            checksum = self._checksums.pop(filename, None)
+                            # Digests of any other file are never used
+                            self._checksums.clear()
+                        # Merged or post-processed outputs were never seen by
+                        # the progress hook and are hashed here instead.
+                        if checksum is None:
+                            checksum = calculate_checksum(filename, self.config.checksum_algorithm)
 
                     return DownloadResult(
                         success=True,
-                        filepath=filepath,
+                        filepath=Path(filename),
                         error=None,
                         metadata=metadata,
                         download_time=time.time() - start_time,
                         filesize=filesize,
-                        checksum=checksum
+                        checksum=checksum,
+                        checksum_algorithm=self.config.checksum_algorithm if checksum else None
                     )
 
-            except UnsupportedPlatformError as e:
-                # Don't retry for unsupported platforms
-                logger.warning(str(e))
-                return DownloadResult(
-                    success=False,
-                    filepath=None,
-                    error=str(e),
-                    metadata=None,
-                    download_time=time.time() - start_time,
-                    filesize=0,
-                    checksum=None
-                )
-
-            except Exception as e:
-                last_error = str(e)
-                logger.error(f"Download attempt {attempt + 1} failed: {last_error}")
-                
-                if attempt < self.config.retries - 1:
-                    sleep_time = 2 ** attempt  # Exponential backoff
-                    logger.info(f"Retrying in {sleep_time} seconds...")
-                    time.sleep(sleep_time)
+                except UnsupportedPlatformError as e:
+                    # Don't retry for unsupported platforms
+                    logger.warning(str(e))
+                    return DownloadResult(
+                        success=False,
+                        filepath=None,
+                        error=str(e),
+                        metadata=None,
+                        download_time=time.time() - start_time,
+                        filesize=0,
+                        checksum=None
+                    )
+
+                except Exception as e:
+                    last_error = str(e)
+                    logger.error(f"Download attempt {attempt + 1} failed: {last_error}")
+
+                    message = last_error.lower()
+                    if isinstance(e, ValidationError) or any(marker in message for marker in _PERMANENT_ERRORS):
+                        # Retrying can't fix these
+                        break
+                    if any(marker in message for marker in _STALE_INFO_ERRORS):
+                        info = None
+
+                    if attempt < self.config.retries - 1:
+                        # Capped exponential backoff with jitter, so concurrent
+                        # downloads don't all retry in lockstep
+                        sleep_time = min(_MAX_RETRY_DELAY, 0.5 * 2 ** attempt) * random.uniform(0.5, 1.5)
+                        logger.info(f"Retrying in {sleep_time:.1f} seconds...")
+                        time.sleep(sleep_time)
 
         # If we get here, all retries failed
         return DownloadResult(
@@ -171,6 +237,17 @@ class VideoDownloader:
             checksum=None
         )
 
+    def download_many(self, urls: List[str], max_workers: int = 4) -> List[DownloadResult]:
+        """Download several URLs concurrently with this downloader's settings."""
+        # Each URL gets its own downloader (and YoutubeDL instance), since
+        # YoutubeDL is not safe to share between threads.
+        downloaders = [
+            VideoDownloader(dataclasses.replace(self.config, url=url), label=url)
+            for url in urls
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(VideoDownloader.download, downloaders))
+
     def _extract_metadata(self, info: Dict) -> VideoMetadata:
         """Extract metadata from downloaded video info."""
         return VideoMetadata(
@@ -197,11 +274,62 @@ class VideoDownloader:
 
     def _progress_hook(self, d: Dict) -> None:
         """Handle download progress updates."""
+        if self._partial_hash is not None:
+            self._update_checksum(d)
+
         if d['status'] == 'downloading':
+            # yt-dlp can call this hundreds of times a second; only redraw
+            # the progress line every _PROGRESS_INTERVAL seconds.
+            now = time.monotonic()
+            if now - self._last_progress_time < _PROGRESS_INTERVAL:
+                return
+            self._last_progress_time = now
+
             if 'total_bytes' in d:
                 percentage = (d['downloaded_bytes'] / d['total_bytes']) * 100
-                print(f"\rDownload progress: {percentage:.1f}%", end='')
+                message = f"Download progress: {percentage:.1f}%"
             else:
-                print(f"\rDownloaded: {d['downloaded_bytes'] / (1024*1024):.1f}MB", end='')
+                message = f"Downloaded: {d['downloaded_bytes'] / (1024*1024):.1f}MB"
+            # Labelled downloads share the terminal, so each update gets its
+            # own line instead of redrawing a single one.
+            self._write_progress(f"[{self._label}] {message}\n" if self._label else f"\r{message}")
         elif d['status'] == 'finished':
-            print("\nDownload completed, processing file...")
\ No newline at end of file
+            message = "Download completed, processing file..."
+            self._write_progress(f"[{self._label}] {message}\n" if self._label else f"\n{message}\n")
+
+    def _write_progress(self, text: str) -> None:
+        """Write a progress update to stdout."""
+        with _OUTPUT_LOCK:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+    def _update_checksum(self, d: Dict) -> None:
+        """Hash newly written bytes so the checksum is ready when the download finishes."""
+        partial = self._partial_hash
+        if partial is None:
+            return
+        with self._hash_lock:
+            try:
+                if d['status'] == 'downloading':
+                    path = d.get('tmpfilename') or d.get('filename')
+                    downloaded = d.get('downloaded_bytes')
+                    if not path or downloaded is None:
+                        return
+                    if path != partial.path or downloaded < partial.offset:
+                        partial.reset(path)
+                    partial.update_to(path, downloaded)
+                elif d['status'] == 'finished':
+                    filename = d.get('filename')
+                    if not filename:
+                        return
+                    # yt-dlp renames the .part file before reporting 'finished'
+                    if (partial.path not in (filename, f"{filename}.part")
+                            or os.path.getsize(filename) < partial.offset):
+                        partial.reset(filename)
+                    partial.update_to(filename)
+                    self._checksums[filename] = partial.hexdigest()
+                    partial.reset()
+            except OSError as e:
+                # download() falls back to hashing the finished file
+                logger.debug(f"Incremental checksum failed: {str(e)}")
+                partial.reset()
@@ -1,14 +1,30 @@
 # src/video_dl/core/processor.py
-import ffmpeg
+import itertools
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Any, Tuple
+from typing import TYPE_CHECKING, Dict, Any, Tuple
 from ..models.config import ProcessingConfig
 from ..exceptions.errors import ProcessingError
-from ..utils.ffmpeg import validate_ffmpeg_installation
+from ..utils.ffmpeg import get_video_info, validate_ffmpeg_installation
+
+if TYPE_CHECKING:
+    import ffmpeg
 
 logger = logging.getLogger(__name__)
 
+# Hardware encoders that replace the software codecs for each --hw-accel backend
+_HW_ENCODERS = {
+    'cuda': {'libx264': 'h264_nvenc', 'h264': 'h264_nvenc', 'libx265': 'hevc_nvenc', 'hevc': 'hevc_nvenc'},
+    'qsv': {'libx264': 'h264_qsv', 'h264': 'h264_qsv', 'libx265': 'hevc_qsv', 'hevc': 'hevc_qsv'},
+    'videotoolbox': {'libx264': 'h264_videotoolbox', 'h264': 'h264_videotoolbox',
+                     'libx265': 'hevc_videotoolbox', 'hevc': 'hevc_videotoolbox'},
+}
+
+# Tone-map HDR (PQ/HLG) down to BT.709 SDR
+_HDR_TO_SDR_FILTERS = ('zscale=t=linear:npl=100,format=gbrp,zscale=p=bt709,'
+                       'tonemap=tonemap=hable,zscale=t=bt709:m=bt709:r=tv')
+
 class VideoProcessor:
     def __init__(self, config: ProcessingConfig):
         self.config = config
@@ -17,7 +33,7 @@ class VideoProcessor:
     def _get_video_info(self, file: Path) -> Dict:
         """Extract video information using ffprobe."""
         try:
-            info = ffmpeg.probe(str(file))
+            info = get_video_info(file)
             # Get the first video stream
             video_stream = next(
                 stream for stream in info['streams'] 
@@ -30,8 +46,8 @@ class VideoProcessor:
                 video_stream['fps'] = num // den  # Integer division for fps
                 
             return video_stream
-        except ffmpeg.Error as e:
-            raise ProcessingError(f"Failed to get video info: {e.stderr.decode()}")
+        except ValueError as e:
+            raise ProcessingError(str(e))
         except (KeyError, StopIteration):
             raise ProcessingError("No video stream found in file")
         
@@ -51,6 +67,8 @@ class VideoProcessor:
         """Validate FFmpeg installation and configuration."""
         if not validate_ffmpeg_installation():
             raise ProcessingError("FFmpeg is not installed or not accessible")
+        if self.config.hw_accel and self.config.hw_accel not in _HW_ENCODERS:
+            raise ProcessingError(f"Unsupported hardware acceleration: {self.config.hw_accel}")
 
     def _validate_crop(self, crop_str: str) -> Tuple[int, int, int, int]:
         """Validate and parse crop parameters."""
@@ -80,39 +98,39 @@ class VideoProcessor:
 
     def process_video(self, input_path: Path) -> Path:
         """Process video according to configuration."""
+        import ffmpeg
         try:
             if not input_path.exists():
                 raise ProcessingError(f"Input file not found: {input_path}")
 
             output_path = self._get_output_path(input_path)
-            stream = ffmpeg.input(str(input_path))
+            stream = ffmpeg.input(str(input_path), **self._get_input_args())
             
-            # Apply filters in sequence
+            # Collect filters in sequence into a single -vf filter chain
+            vf_parts = []
             if self.config.crop:
                 # Validate and get crop parameters
                 w, h, x, y = self._validate_crop(self.config.crop)
-                stream = stream.filter('crop', w, h, x, y)
+                vf_parts.append(f"crop={w}:{h}:{x}:{y}")
             
             if self.config.resize:
                 # Validate and get resize parameters
                 w, h = self._validate_resize(self.config.resize)
-                stream = stream.filter('scale', w, h)
+                vf_parts.append(f"scale={w}:{h}")
 
             if self.config.fps:
-                stream = stream.filter('fps', fps=self.config.fps)
+                vf_parts.append(f"fps=fps={self.config.fps}")
 
             if self.config.hdr_to_sdr:
-                stream = (stream
-                    .filter('zscale', t='linear', npl=100)
-                    .filter('format', pix_fmt='gbrp')
-                    .filter('zscale', p='bt709')
-                    .filter('tonemap', tonemap='hable')
-                    .filter('zscale', t='bt709', m='bt709', r='tv'))
+                vf_parts.append(_HDR_TO_SDR_FILTERS)
 
             # Get output arguments
             output_args = self._get_output_args()
+            if vf_parts:
+                output_args['vf'] = ','.join(vf_parts)
 
-            # Create output stream
+            # Create output stream; without a filter node in the graph ffmpeg
+            # keeps its default stream selection, so audio is carried over.
             stream = ffmpeg.output(stream, str(output_path), **output_args)
             
             # Run FFmpeg
@@ -125,7 +143,7 @@ class VideoProcessor:
             error_msg = e.stderr.decode() if hasattr(e, 'stderr') else str(e)
             raise ProcessingError(f"FFmpeg error: {error_msg}")
 
-    def _apply_video_filters(self, stream) -> ffmpeg.Stream:
+    def _apply_video_filters(self, stream) -> 'ffmpeg.Stream':
         """Apply video filters based on configuration."""
         filters = []
         
@@ -180,7 +198,7 @@ class VideoProcessor:
         
         return stream
 
-    def _handle_audio(self, stream) -> ffmpeg.Stream:
+    def _handle_audio(self, stream) -> 'ffmpeg.Stream':
         """Handle audio processing based on configuration."""
         if self.config.remove_audio:
             return stream.audio(None)
@@ -195,12 +213,24 @@ class VideoProcessor:
         
         return stream
 
+    def _get_input_args(self) -> Dict[str, Any]:
+        """Get FFmpeg input arguments."""
+        if self.config.hw_accel:
+            # Decoded frames are copied back to system memory so the
+            # software filters above keep working.
+            return {'hwaccel': self.config.hw_accel}
+        return {}
+
     def _get_output_args(self) -> Dict[str, Any]:
         """Get FFmpeg output arguments."""
         args = {}
         
-        if self.config.video_codec:
-            args['vcodec'] = self.config.video_codec
+        video_codec = self.config.video_codec
+        if self.config.hw_accel:
+            video_codec = _HW_ENCODERS[self.config.hw_accel].get(video_codec or 'libx264', video_codec)
+
+        if video_codec:
+            args['vcodec'] = video_codec
             
         if self.config.video_bitrate:
             args['b:v'] = self.config.video_bitrate
@@ -218,12 +248,18 @@ class VideoProcessor:
         if self.config.extract_audio:
             suffix = f".{self.config.audio_format}"
             
-        output_path = input_path.with_name(f"{stem}_processed{suffix}")
-        
-        # Ensure unique filename
-        counter = 1
-        while output_path.exists():
-            output_path = input_path.with_name(f"{stem}_processed_{counter}{suffix}")
-            counter += 1
+        # Ensure unique filename against one directory listing, not a stat per candidate
+        try:
+            with os.scandir(input_path.parent) as entries:
+                existing = {entry.name for entry in entries}
+        except FileNotFoundError:
+            existing = set()
+
+        name = f"{stem}_processed{suffix}"
+        if name in existing:
+            for counter in itertools.count(1):
+                name = f"{stem}_processed_{counter}{suffix}"
+                if name not in existing:
+                    break
             
-        return output_path
\ No newline at end of file
+        return input_path.with_name(name)
\ No newline at end of file
@@ -1,22 +1,68 @@
 # src/video_dl/core/subtitle.py
 from pathlib import Path
-import chardet
+import codecs
+import mmap
+import os
 import re
-from typing import Dict, List
+import shutil
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple
 from ..models.config import SubtitleConfig
 from ..exceptions.errors import SubtitleError
-import yt_dlp
+from ..utils.filesystem import append_file
 import logging
 
 logger = logging.getLogger(__name__)
 
+_DETECT_SAMPLE_SIZE = 64 * 1024  # Detection accuracy levels off well before this
+_TRANSCODE_CHUNK_SIZE = 64 * 1024  # Characters per read when re-encoding
+
+_YT_URL_RE = re.compile(r"https?://(?:www\.)?(?:youtube\.com|youtu\.be)/\S+")
+# Byte patterns: the tag delimiters are ASCII, so UTF-8 text needs no decoding
+_HTML_TAG_RE = re.compile(rb"<[^>]+>")
+_SSA_TAG_RE = re.compile(rb"\{[^}]+\}")
+_VTT_HEADER_RE = re.compile(r"\A.*?^[^\S\n]*$\n?", re.DOTALL | re.MULTILINE)
+_VTT_TIMING_RE = re.compile(r"^.*-->.*$", re.MULTILINE)
+
+
+@lru_cache(maxsize=None)
+def _encoding_detector() -> Callable[[bytes], Dict]:
+    """Return the fastest available detector; imported on first use."""
+    # All return chardet's {'encoding', 'confidence'} dict
+    try:
+        from cchardet import detect
+    except ImportError:
+        try:
+            from charset_normalizer import detect
+        except ImportError:
+            from chardet import detect
+    return detect
+
+
+def _is_utf8_compatible(encoding: str) -> bool:
+    """Whether text in this encoding is already valid UTF-8."""
+    return encoding.lower().replace('-', '').replace('_', '') in ('utf8', 'ascii')
+
+
+def _decodes_as_utf8(file: Path) -> bool:
+    """Check the whole file decodes as UTF-8 without holding it in memory."""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        with open(file, 'rb') as f:
+            for chunk in iter(lambda: f.read(_DETECT_SAMPLE_SIZE), b''):
+                decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
+
 
 class SubtitleDownloader:
     def __init__(self, config: SubtitleConfig):
         self.config = config
         self._validate_config()
+        # SubtitleConfig has already created the directory
         self.output_path = config.output_path
-        self.output_path.mkdir(parents=True, exist_ok=True)
 
     def _validate_config(self) -> None:
         """Validate configuration."""
@@ -24,8 +70,7 @@ class SubtitleDownloader:
             raise SubtitleError("URL cannot be empty")
 
         # Basic URL validation
-        url_pattern = r"https?://(?:www\.)?(?:youtube\.com|youtu\.be)/\S+"
-        if not re.match(url_pattern, self.config.url):
+        if not _YT_URL_RE.match(self.config.url):
             raise SubtitleError("Invalid URL format")
 
     def _fix_encoding(self, file: Path) -> None:
@@ -34,18 +79,37 @@ class SubtitleDownloader:
             logger.error(f"File not found: {file}")
             raise FileNotFoundError(f"File not found: {file}")
             
+        tmp_file = file.with_name(f"{file.name}.tmp")
         try:
-            raw_data = file.read_bytes()
-            detected = chardet.detect(raw_data)
+            with open(file, 'rb') as f:
+                sample = f.read(_DETECT_SAMPLE_SIZE)
+            detected = _encoding_detector()(sample)
             if not detected['encoding']:
                 raise SubtitleError(f"Could not detect encoding for {file}")
                 
-            current_encoding = detected['encoding'] if detected['confidence'] > 0.7 else 'utf-8'
+            confident = detected['confidence'] > 0.7
+            current_encoding = detected['encoding'] if confident else 'utf-8'
+            if _is_utf8_compatible(current_encoding):
+                # Only a confident result for the whole file is trusted as is;
+                # a guess, or a clean sample of a longer file, is verified
+                whole_file = len(sample) < _DETECT_SAMPLE_SIZE
+                if (confident and whole_file) or _decodes_as_utf8(file):
+                    # Already valid UTF-8; nothing to rewrite
+                    return
+                if not whole_file:
+                    detected = _encoding_detector()(file.read_bytes())
+                    if not detected['encoding']:
+                        raise SubtitleError(f"Could not detect encoding for {file}")
+                    current_encoding = detected['encoding'] if detected['confidence'] > 0.7 else 'utf-8'
             
-            content = raw_data.decode(current_encoding)
-            file.write_text(content, encoding='utf-8')
+            # Transcode in chunks to a sibling file, then swap it into place
+            with open(file, 'r', encoding=current_encoding, newline='') as rf, \
+                    open(tmp_file, 'w', encoding='utf-8', newline='') as wf:
+                shutil.copyfileobj(rf, wf, _TRANSCODE_CHUNK_SIZE)
+            os.replace(tmp_file, file)
             logger.info(f"Fixed encoding for {file.name}")
         except Exception as e:
+            tmp_file.unlink(missing_ok=True)
             logger.error(f"Failed to fix encoding for {file.name}: {str(e)}")
             raise
 
@@ -64,49 +128,10 @@ class SubtitleDownloader:
             # Convert offset to exact milliseconds
             offset_ms = round(offset * 1000)  # Round to nearest millisecond
             
+            # SubRipTime.ordinal is the time in milliseconds; shift it in place
             for sub in subs:
-                # Calculate total milliseconds
-                start_ms = (sub.start.hours * 3600000 + 
-                        sub.start.minutes * 60000 + 
-                        sub.start.seconds * 1000 + 
-                        sub.start.milliseconds)
-                end_ms = (sub.end.hours * 3600000 + 
-                        sub.end.minutes * 60000 + 
-                        sub.end.seconds * 1000 + 
-                        sub.end.milliseconds)
-                
-                # Apply offset
-                new_start_ms = max(0, start_ms + offset_ms)
-                new_end_ms = max(0, end_ms + offset_ms)
-                
-                # Convert milliseconds back to hours, minutes, seconds, milliseconds
-                start_hours = new_start_ms // 3600000
-                start_remainder = new_start_ms % 3600000
-                start_minutes = start_remainder // 60000
-                start_remainder %= 60000
-                start_seconds = start_remainder // 1000
-                start_milliseconds = start_remainder % 1000
-                
-                end_hours = new_end_ms // 3600000
-                end_remainder = new_end_ms % 3600000
-                end_minutes = end_remainder // 60000
-                end_remainder %= 60000
-                end_seconds = end_remainder // 1000
-                end_milliseconds = end_remainder % 1000
-                
-                # Create new SubRipTime objects
-                sub.start = pysrt.SubRipTime(
-                    hours=int(start_hours),
-                    minutes=int(start_minutes),
-                    seconds=int(start_seconds),
-                    milliseconds=int(start_milliseconds)
-                )
-                sub.end = pysrt.SubRipTime(
-                    hours=int(end_hours),
-                    minutes=int(end_minutes),
-                    seconds=int(end_seconds),
-                    milliseconds=int(end_milliseconds)
-                )
+                sub.start.ordinal = max(0, sub.start.ordinal + offset_ms)
+                sub.end.ordinal = max(0, sub.end.ordinal + offset_ms)
             
             # Save with Unix-style line endings for consistency
             subs.save(str(file), encoding='utf-8')
@@ -118,6 +143,8 @@ class SubtitleDownloader:
 
     def download(self) -> List[Path]:
         """Download subtitles according to configuration."""
+        import yt_dlp
+
         try:
             downloaded_files = []
             opts = self._get_ydl_opts()
@@ -128,29 +155,34 @@ class SubtitleDownloader:
                 title = info.get('title', '').replace('/', '_')
                 logger.debug(f"Video title: {title}")
                 
-                # First check for existing files in all requested formats
+                # Bucket subtitle files by (lang, format) in one directory scan
+                wanted = {(lang, fmt) for lang in self.config.languages for fmt in self.config.formats}
+                found: Dict[Tuple[str, str], List[Path]] = {}
+                with os.scandir(self.output_path) as entries:
+                    for entry in entries:
+                        parts = entry.name.rsplit('.', 2)
+                        if len(parts) == 3 and (parts[1], parts[2]) in wanted and entry.is_file():
+                            found.setdefault((parts[1], parts[2]), []).append(Path(entry.path))
+                
                 for lang in self.config.languages:
                     for fmt in self.config.formats:
-                        pattern = f"*.{lang}.{fmt}"
-                        logger.debug(f"Searching for pattern: {pattern}")
-                        for file in self.output_path.glob(pattern):
+                        for file in found.get((lang, fmt), []):
                             logger.debug(f"Found file: {file}")
-                            if file.exists():
-                                if self.config.fix_encoding:
-                                    self._fix_encoding(file)
-                                
-                                if self.config.convert_to_srt and file.suffix == '.vtt':
-                                    new_file = self._convert_to_srt(file)
-                                    if new_file != file:
-                                        file.unlink()
-                                        file = new_file
-                                        logger.debug(f"Converted to SRT: {new_file}")
-                                
-                                if self.config.remove_formatting:
-                                    self._remove_formatting(file)
-                                
-                                downloaded_files.append(file)
-                                logger.debug(f"Added file to results: {file}")
+                            if self.config.fix_encoding:
+                                self._fix_encoding(file)
+                            
+                            if self.config.convert_to_srt and file.suffix == '.vtt':
+                                new_file = self._convert_to_srt(file)
+                                if new_file != file:
+                                    file.unlink()
+                                    file = new_file
+                                    logger.debug(f"Converted to SRT: {new_file}")
+                            
+                            if self.config.remove_formatting:
+                                self._remove_formatting(file)
+                            
+                            downloaded_files.append(file)
+                            logger.debug(f"Added file to results: {file}")
                 
                 # Handle case when VTT was downloaded but SRT was requested
                 if 'srt' in self.config.formats and not any(f.suffix == '.srt' for f in downloaded_files):
@@ -198,27 +230,18 @@ class SubtitleDownloader:
                 content = file.read_text(encoding='utf-8')
                 
                 if 'WEBVTT' in content:
-                    lines = content.split('\n')
-                    srt_lines = []
-                    counter = 1
-                    skip_webvtt_header = True
-                    
-                    for line in lines:
-                        if skip_webvtt_header:
-                            if line.strip() == '':
-                                skip_webvtt_header = False
-                            continue
-                        
-                        if '-->' in line:
-                            # Convert VTT timestamp format to SRT format
-                            line = line.replace('.', ',')
-                            srt_lines.append(str(counter))
-                            srt_lines.append(line)
-                            counter += 1
-                        else:
-                            srt_lines.append(line)
-                    
-                    srt_file.write_text('\n'.join(srt_lines), encoding='utf-8')
+                    # Drop the header block, up to and including the first blank line
+                    header = _VTT_HEADER_RE.match(content)
+                    body = content[header.end():] if header else ''
+                    # Number each cue and switch its timestamps to SRT's comma
+                    # separator, writing pieces out instead of building a copy
+                    with open(srt_file, 'w', encoding='utf-8') as out:
+                        pos = 0
+                        for number, m in enumerate(_VTT_TIMING_RE.finditer(body), 1):
+                            out.write(body[pos:m.start()])
+                            out.write(f"{number}\n{m.group(0).replace('.', ',')}")
+                            pos = m.end()
+                        out.write(body[pos:])
                     logger.info(f"Converted {file} to SRT format")
                     return srt_file
             
@@ -231,6 +254,8 @@ class SubtitleDownloader:
 
     def list_available_subtitles(self) -> Dict[str, List[str]]:
         """List all available subtitles for a video."""
+        import yt_dlp
+
         try:
             with yt_dlp.YoutubeDL({
                 'skip_download': True,
@@ -255,26 +280,33 @@ class SubtitleDownloader:
 
     def _remove_formatting(self, file: Path) -> None:
         """Remove formatting tags."""
+        tmp_file = file.with_name(f"{file.name}.tmp")
         try:
-            content = file.read_text(encoding="utf-8")
-            # Remove HTML tags
-            content = re.sub(r"<[^>]+>", "", content)
-            # Remove SSA/ASS style tags
-            content = re.sub(r"\{[^}]+\}", "", content)
-            file.write_text(content, encoding="utf-8")
+            with open(file, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return  # mmap can't map an empty file
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Remove HTML tags, then SSA/ASS style tags
+                    content = _SSA_TAG_RE.sub(b"", _HTML_TAG_RE.sub(b"", mm))
+            tmp_file.write_bytes(content)
+            os.replace(tmp_file, file)
         except Exception as e:
+            tmp_file.unlink(missing_ok=True)
             logger.error(f"Failed to remove formatting from {file}: {str(e)}")
 
     def _merge_subtitles(self, files: List[Path]) -> Path:
         """Merge multiple subtitle files."""
         try:
             merged_file = self.output_path / "merged_subtitles.srt"
-            with open(merged_file, "w", encoding="utf-8") as outfile:
-                for i, file in enumerate(files, 1):
-                    content = file.read_text(encoding="utf-8")
-                    outfile.write(content)
-                    if not content.endswith("\n\n"):
-                        outfile.write("\n\n")
+            # Files are already UTF-8, so they're concatenated as raw bytes
+            with open(merged_file, "wb") as outfile:
+                for file in files:
+                    size = append_file(file, outfile)
+                    with open(file, "rb") as infile:
+                        infile.seek(max(0, size - 2))
+                        tail = infile.read(2)
+                    if tail != b"\n\n":
+                        outfile.write(b"\n\n")
             return merged_file
         except Exception as e:
             logger.error(f"Failed to merge subtitles: {str(e)}")
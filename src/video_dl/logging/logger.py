@@ -1,34 +1,54 @@
 # src/video_dl/logging/logger.py
 import logging
+import os
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
+
+# Names already given handlers; the lock stops concurrent first calls from
+# both attaching them and writing every record twice
+_CONFIGURED: Set[str] = set()
+_LOGGER_LOCK = threading.Lock()
 
 def get_logger(name: str, log_file: Optional[Path] = None) -> logging.Logger:
     """Configure and return a logger instance."""
     logger = logging.getLogger(name)
-    
-    if not logger.handlers:
-        logger.setLevel(logging.INFO)
-        
-        # Create formatters
-        console_formatter = logging.Formatter(
-            '%(message)s'
-        )
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
-        
-        # File handler if log_file is specified
-        if log_file:
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
-    
-    return logger
\ No newline at end of file
+    if name in _CONFIGURED:
+        return logger
+
+    with _LOGGER_LOCK:
+        if name not in _CONFIGURED and not logger.handlers:
+            _configure(logger, log_file)
+        _CONFIGURED.add(name)
+
+    return logger
+
+def _configure(logger: logging.Logger, log_file: Optional[Path]) -> None:
+    """Attach console and, if log_file is given, file handlers."""
+    logger.setLevel(logging.INFO)
+
+    if os.environ.get('VIDEO_DL_QUIET', '') not in ('', '0'):
+        # Records are dropped here instead of being formatted for stdout
+        logger.addHandler(logging.NullHandler())
+        return
+
+    # Create formatters
+    console_formatter = logging.Formatter(
+        '%(message)s'
+    )
+    file_formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    # Console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(console_formatter)
+    logger.addHandler(console_handler)
+
+    # File handler if log_file is specified; opened on the first record
+    if log_file:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.FileHandler(log_file, delay=True)
+        file_handler.setFormatter(file_formatter)
+        logger.addHandler(file_handler)
@@ -0,0 +1,5 @@
+# src/video_dl/models/_compat.py
+import sys
+
+# Slotted instances drop the per-object __dict__ (Python 3.10+)
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
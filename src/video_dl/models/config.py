@@ -1,9 +1,34 @@
 # src/video_dl/models/config.py
 from dataclasses import dataclass, field
-from typing import Optional, List
+from functools import lru_cache
+from typing import Optional, List, Set
 from pathlib import Path
+import threading
+from ._compat import DATACLASS_OPTIONS
 
-@dataclass
+# Output directories already created by this process; batch runs build many
+# configs for the same directory and only the first needs the mkdir.
+_CREATED_DIRS: Set[Path] = set()
+_CREATED_DIRS_LOCK = threading.Lock()
+
+def _ensure_output_dir(path: Path) -> None:
+    """Create path (and parents) once per process."""
+    if path in _CREATED_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    # Relative paths depend on the working directory, so they aren't remembered
+    if path.is_absolute():
+        with _CREATED_DIRS_LOCK:
+            _CREATED_DIRS.add(path)
+
+@lru_cache(maxsize=32)
+def _normalize_quality(quality: str) -> str:
+    """Append the 'p' suffix to bare heights ('720' -> '720p')."""
+    if quality != 'best' and not quality.endswith('p'):
+        return f"{quality}p"
+    return quality
+
+@dataclass(**DATACLASS_OPTIONS)
 class ProcessingConfig:
     """Video processing configuration."""
     crop: Optional[str] = None
@@ -20,13 +45,14 @@ class ProcessingConfig:
     stabilize: bool = False
     denoise: bool = False
     hdr_to_sdr: bool = False
+    hw_accel: Optional[str] = None  # 'cuda', 'qsv' or 'videotoolbox'
 
     def __post_init__(self):
         """Validate configuration values."""
         # No validation in post_init, moved to processor methods
         pass
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class DownloadConfig:
     """Download configuration."""
     url: str
@@ -45,6 +71,9 @@ class DownloadConfig:
     verify_ssl: bool = True
     retries: int = 3
     rate_limit: Optional[str] = None
+    compute_checksum: bool = False
+    checksum_algorithm: str = 'sha256'
+    fragment_workers: int = 8
 
     def __post_init__(self):
         """Convert string paths to Path objects and validate configuration."""
@@ -54,13 +83,12 @@ class DownloadConfig:
             self.cookies_file = Path(self.cookies_file)
         
         # Validate quality setting
-        if self.quality != 'best' and not self.quality.endswith('p'):
-            self.quality = f"{self.quality}p"
+        self.quality = _normalize_quality(self.quality)
         
         # Create output directory
-        self.output_path.mkdir(parents=True, exist_ok=True)
+        _ensure_output_dir(self.output_path)
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class SubtitleConfig:
     """Subtitle configuration."""
     url: str
@@ -77,5 +105,5 @@ class SubtitleConfig:
     def __post_init__(self):
         if isinstance(self.output_path, str):
             self.output_path = Path(self.output_path)
-        self.output_path.mkdir(parents=True, exist_ok=True)
+        _ensure_output_dir(self.output_path)
 
@@ -3,8 +3,9 @@ from dataclasses import dataclass
 from typing import Optional, List
 from pathlib import Path
 from datetime import datetime
+from ._compat import DATACLASS_OPTIONS
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class VideoMetadata:
     """Video metadata information."""
     title: str
@@ -27,7 +28,7 @@ class VideoMetadata:
     acodec: Optional[str]
     filesize: Optional[int]
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class DownloadResult:
     """Download result information."""
     success: bool
@@ -36,4 +37,5 @@ class DownloadResult:
     metadata: Optional[VideoMetadata]
     download_time: float
     filesize: int
-    checksum: Optional[str]
\ No newline at end of file
+    checksum: Optional[str]
+    checksum_algorithm: Optional[str] = None
@@ -1,13 +1,56 @@
 # src/video_dl/utils/ffmpeg.py
 import subprocess
 import json
+import re
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, FrozenSet, Optional, Union
 import shutil
 import logging
 
 logger = logging.getLogger(__name__)
 
+_json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    # C parser, several times faster on large ffprobe output
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# One `ffmpeg -codecs` row: capability flags, codec name, then the description,
+# which may list the concrete "(decoders: ...)" and "(encoders: ...)"
+_CODEC_LINE_RE = re.compile(r"^ [D.][E.][VASDT.][I.][L.][S.] +([^\s=]\S*)(.*)$", re.MULTILINE)
+_CODER_LIST_RE = re.compile(r"\((?:de|en)coders: ([^)]*)\)")
+
+_codecs: Optional[FrozenSet[str]] = None
+_codecs_lock = threading.Lock()
+
+def _parse_codecs(output: str) -> FrozenSet[str]:
+    """Collect codec, decoder and encoder names from `ffmpeg -codecs` output."""
+    names = set()
+    for m in _CODEC_LINE_RE.finditer(output):
+        names.add(m.group(1))
+        for coders in _CODER_LIST_RE.findall(m.group(2)):
+            names.update(coders.split())
+    return frozenset(names)
+
+def _supported_codecs() -> FrozenSet[str]:
+    """Run `ffmpeg -codecs` once per process; the lock keeps threads from racing it."""
+    global _codecs
+    with _codecs_lock:
+        if _codecs is None:
+            result = subprocess.run(
+                ['ffmpeg', '-codecs'],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            _codecs = _parse_codecs(result.stdout)
+        return _codecs
+
+@lru_cache(maxsize=None)
 def validate_ffmpeg_installation() -> bool:
     """Validate FFmpeg installation and capabilities."""
     try:
@@ -21,6 +64,18 @@ def validate_ffmpeg_installation() -> bool:
         logger.error(f"FFmpeg validation failed: {str(e)}")
         return False
 
+@lru_cache(maxsize=128)
+def _ffprobe_json(path: str, mtime_ns: int, size: int) -> bytes:
+    """Run ffprobe once per file version; mtime and size key the cache."""
+    return subprocess.run([
+        'ffprobe',
+        '-v', 'quiet',
+        '-print_format', 'json',
+        '-show_format',
+        '-show_streams',
+        path
+    ], capture_output=True, check=True).stdout
+
 def get_video_info(file_path: Path) -> Dict:
     """
     Get video file information using FFprobe.
@@ -38,22 +93,12 @@ def get_video_info(file_path: Path) -> Dict:
         raise ValueError(f"File not found: {file_path}")
 
     try:
-        # First check if file is readable
-        with open(file_path, 'rb') as f:
-            # Read first few bytes to verify it's accessible
-            f.read(1024)
-
-        result = subprocess.run([
-            'ffprobe',
-            '-v', 'quiet',
-            '-print_format', 'json',
-            '-show_format',
-            '-show_streams',
-            str(file_path)
-        ], capture_output=True, text=True, check=True)
+        st = file_path.stat()
+        output = _ffprobe_json(str(file_path), st.st_mtime_ns, st.st_size)
 
         try:
-            info = json.loads(result.stdout)
+            # Parsed per call so callers never share a mutable result
+            info = _json_loads(output)
             if not info or 'streams' not in info:
                 raise ValueError("FFprobe returned invalid data")
             return info
@@ -61,7 +106,7 @@ def get_video_info(file_path: Path) -> Dict:
             raise ValueError(f"Failed to parse FFprobe output: {str(e)}")
 
     except subprocess.CalledProcessError as e:
-        error_msg = e.stderr or "No error message provided"
+        error_msg = e.stderr.decode(errors='replace') if e.stderr else "No error message provided"
         raise ValueError(f"FFprobe failed: {error_msg}")
     except Exception as e:
         raise ValueError(f"Failed to get video info: {str(e)}")
@@ -77,13 +122,7 @@ def check_codec_support(codec: str) -> bool:
         True if codec is supported, False otherwise
     """
     try:
-        result = subprocess.run(
-            ['ffmpeg', '-codecs'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return codec in result.stdout
+        return codec in _supported_codecs()
     except subprocess.CalledProcessError:
         logger.error(f"Failed to check codec support for {codec}")
         return False
@@ -1,39 +1,133 @@
 # src/video_dl/utils/filesystem.py
+import errno
+import fnmatch
+import heapq
+import mmap
 import os
 import shutil
 import hashlib
+import tempfile
 from pathlib import Path
-from typing import Optional, List, Generator
+from typing import BinaryIO, Optional, List, Generator
 import logging
 
 logger = logging.getLogger(__name__)
 
+_CHECKSUM_CHUNK_SIZE = 1 << 20
+_CHECKSUM_MMAP_THRESHOLD = 64 << 20  # Map larger files and hash them in one call
+# blake3 only spreads work across threads within one update() call, so it
+# gets the whole file mapped as soon as that beats the readinto loop
+_BLAKE3_MMAP_THRESHOLD = 64 << 10
+# Characters not allowed in filenames, each mapped to an underscore
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+_INVALID_FILENAME_BYTES = bytes.maketrans(b'<>:"/\\|?*', b'_' * 9)
+
 def ensure_directory(path: Path) -> None:
     """Ensure directory exists, create if necessary."""
     path.mkdir(parents=True, exist_ok=True)
 
+def new_hash(algorithm: str = 'sha256'):
+    """Create a hash object; 'blake3' needs the optional blake3 package."""
+    if algorithm == 'blake3':
+        try:
+            import blake3
+        except ImportError:
+            raise ValueError("blake3 checksums require the 'blake3' package")
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.new(algorithm)
+
 def calculate_checksum(file_path: Path, algorithm: str = 'sha256') -> str:
     """Calculate file checksum."""
-    hash_func = getattr(hashlib, algorithm)()
-    
-    with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b''):
-            hash_func.update(chunk)
-            
+    if algorithm != 'blake3' and hasattr(hashlib, 'file_digest'):
+        # Python 3.11+: hashes in C with the GIL released
+        with open(file_path, 'rb', buffering=0) as f:
+            return hashlib.file_digest(f, algorithm).hexdigest()
+
+    hash_func = new_hash(algorithm)
+
+    with open(file_path, 'rb', buffering=0) as f:
+        threshold = _BLAKE3_MMAP_THRESHOLD if algorithm == 'blake3' else _CHECKSUM_MMAP_THRESHOLD
+        if os.fstat(f.fileno()).st_size > threshold:
+            # A single update over the mapping hashes in C without the GIL
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hash_func.update(mm)
+            return hash_func.hexdigest()
+
+        # Read 1 MiB at a time into one reusable buffer
+        buf = memoryview(bytearray(_CHECKSUM_CHUNK_SIZE))
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            hash_func.update(buf[:n])
+
     return hash_func.hexdigest()
 
+class IncrementalChecksum:
+    """Hash a file that is still being written, picking up where the last update stopped."""
+
+    def __init__(self, algorithm: str = 'sha256'):
+        self.algorithm = algorithm
+        self._buf = memoryview(bytearray(_CHECKSUM_CHUNK_SIZE))
+        self.reset()
+
+    def reset(self, path: Optional[str] = None) -> None:
+        """Start over, optionally for a different file."""
+        self.path = path
+        self.offset = 0
+        self._hash = new_hash(self.algorithm)
+
+    def update_to(self, path: str, end: Optional[int] = None) -> None:
+        """Hash bytes from the current offset up to ``end`` (or EOF)."""
+        with open(path, 'rb', buffering=0) as f:
+            f.seek(self.offset)
+            while end is None or self.offset < end:
+                want = _CHECKSUM_CHUNK_SIZE if end is None else min(_CHECKSUM_CHUNK_SIZE, end - self.offset)
+                # Stops early on a short read; data still buffered by the
+                # writer is picked up on the next call.
+                n = f.readinto(self._buf[:want])
+                if not n:
+                    break
+                self._hash.update(self._buf[:n])
+                self.offset += n
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+def append_file(src: Path, outfile: BinaryIO) -> int:
+    """Append the contents of src to an open binary file; returns bytes copied."""
+    # Anything still buffered in outfile must land before the kernel copy
+    outfile.flush()
+    with open(src, 'rb') as infile:
+        size = os.fstat(infile.fileno()).st_size
+        if hasattr(os, 'sendfile'):
+            start = outfile.tell()
+            try:
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(outfile.fileno(), infile.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return offset
+            except OSError:
+                # e.g. filesystems without sendfile support; redo in userspace
+                outfile.seek(start)
+                outfile.truncate()
+        shutil.copyfileobj(infile, outfile)
+        return size
+
 def get_free_space(path: Path) -> int:
     """Get free space in bytes at given path."""
     return shutil.disk_usage(path).free
 
 def clean_filename(filename: str) -> str:
     """Clean filename of invalid characters."""
-    # Replace invalid characters with underscore
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    # Limit length
-    return filename[:255]
+    # Replace invalid characters with underscore in one pass, then limit length
+    if filename.isascii():
+        # Byte tables are a plain lookup, no per-character dict access
+        return filename.encode('ascii').translate(_INVALID_FILENAME_BYTES)[:255].decode('ascii')
+    return filename.translate(_INVALID_FILENAME_CHARS)[:255]
 
 def find_files(
     directory: Path,
@@ -41,40 +135,65 @@ def find_files(
     recursive: bool = False
 ) -> Generator[Path, None, None]:
     """Find files matching pattern in directory."""
-    if recursive:
-        for path in directory.rglob(pattern):
-            if path.is_file():
-                yield path
-    else:
-        for path in directory.glob(pattern):
-            if path.is_file():
-                yield path
+    for path in _scan_files(str(directory), pattern, recursive):
+        yield Path(path)
+
+def _scan_files(directory: str, pattern: str, recursive: bool = False) -> Generator[str, None, None]:
+    """Yield paths of files whose names match pattern, walking with scandir."""
+    # DirEntry.is_file() answers from the directory listing, no stat per file
+    stack = [directory]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif fnmatch.fnmatch(entry.name, pattern) and entry.is_file():
+                        yield entry.path
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            # Missing or unreadable directories yield nothing, as glob did
+            continue
 
 def safe_move(src: Path, dst: Path) -> Path:
     """Safely move file, ensuring unique destination."""
     if not dst.parent.exists():
         dst.parent.mkdir(parents=True)
         
-    if dst.exists():
-        base = dst.parent / dst.stem
-        suffix = dst.suffix
-        counter = 1
-        while dst.exists():
-            dst = base.with_name(f"{base.name}_{counter}{suffix}")
-            counter += 1
+    reserved = dst.exists()
+    if reserved:
+        # Reserve a unique sibling name atomically instead of probing _1, _2, ...
+        fd, name = tempfile.mkstemp(prefix=f"{dst.stem}_", suffix=dst.suffix, dir=dst.parent)
+        os.close(fd)
+        dst = Path(name)
     
-    shutil.move(str(src), str(dst))
+    try:
+        # Same filesystem: a single atomic rename (replacing any reserved placeholder)
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            if reserved:
+                dst.unlink(missing_ok=True)
+            raise
+        shutil.move(str(src), str(dst))
     return dst
 
 def cleanup_temp_files(directory: Path, pattern: str = '*') -> None:
     """Clean up temporary files in directory."""
     try:
-        for file in directory.glob(pattern):
-            if file.is_file():
-                file.unlink()
+        for path in _scan_files(str(directory), pattern):
+            os.unlink(path)
     except Exception as e:
         logger.error(f"Failed to cleanup temp files: {str(e)}")
 
+def _disk_usage(st: os.stat_result) -> int:
+    """File size, less any unallocated (sparse) regions."""
+    # st_blocks is in 512-byte units on POSIX; Windows only has st_size.
+    # Capped at st_size so block rounding never inflates small files.
+    blocks = getattr(st, 'st_blocks', None)
+    if blocks is None:
+        return st.st_size
+    return min(st.st_size, blocks * 512)
+
 class FileRotator:
     """Rotate old files to maintain disk space."""
     
@@ -84,23 +203,32 @@ class FileRotator:
         self.pattern = pattern
     
     def rotate(self) -> None:
-        """Remove oldest files if total size exceeds max_size."""
+        """Remove oldest files if their total size exceeds max_size."""
         total_size = 0
         files = []
         
-        # Get all files and their info
-        for file in self.directory.glob(self.pattern):
-            if file.is_file():
-                size = file.stat().st_size
-                files.append((file, size, file.stat().st_mtime))
-                total_size += size
+        # Get all files and their info; scandir entries cache one stat each
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if fnmatch.fnmatch(entry.name, self.pattern) and entry.is_file():
+                        st = entry.stat()
+                        size = _disk_usage(st)
+                        files.append((st.st_mtime, size, entry.path))
+                        total_size += size
+        except FileNotFoundError:
+            return
+        
+        if total_size <= self.max_size:
+            return
         
-        # Sort by modification time (oldest first)
-        files.sort(key=lambda x: x[2])
+        # Pop oldest first without sorting files that will be kept
+        heapq.heapify(files)
         
         # Remove oldest files until under max_size
         while total_size > self.max_size and files:
-            file, size, _ = files.pop(0)
+            _, size, path = heapq.heappop(files)
+            file = Path(path)
             try:
                 file.unlink()
                 total_size -= size
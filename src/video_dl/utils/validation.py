@@ -1,14 +1,17 @@
 # src/video_dl/utils/validation.py
 from typing import Optional
 import re
-from urllib.parse import urlparse
+
+# A scheme and a non-empty netloc, checked without building a ParseResult
+_URL_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.\-]*://[^\s/?#]+')
+_OUTPUT_PATH_RE = re.compile(r'^[\w\-. /\\]+$')
+_FORMAT_ID_RE = re.compile(r'^[\w\-+]+$')
 
 def validate_url(url: str) -> bool:
     """Validate if string is a valid URL."""
     try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except Exception:
+        return bool(_URL_RE.match(url))
+    except TypeError:
         return False
 
 def validate_output_path(path: str) -> Optional[str]:
@@ -17,12 +20,12 @@ def validate_output_path(path: str) -> Optional[str]:
         return "Output path cannot be empty"
     if len(path) > 255:
         return "Output path too long"
-    if not re.match(r'^[\w\-. /\\]+$', path):
+    if not _OUTPUT_PATH_RE.match(path):
         return "Output path contains invalid characters"
     return None
 
 def validate_format_id(format_id: str) -> Optional[str]:
     """Validate format ID."""
-    if not re.match(r'^[\w\-+]+$', format_id):
+    if not _FORMAT_ID_RE.match(format_id):
         return "Invalid format ID"
     return None
\ No newline at end of file
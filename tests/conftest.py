@@ -1,27 +1,81 @@
 # tests/conftest.py
+import os
+import shutil
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 import pytest
 from pathlib import Path
-import tempfile
+
+# Keep library loggers off stdout; set before any video_dl module is imported
+os.environ.setdefault('VIDEO_DL_QUIET', '1')
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--run-network', action='store_true', default=False,
+        help='run tests that need real network access'
+    )
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--run-network'):
+        return
+    skip_network = pytest.mark.skip(reason='needs --run-network')
+    for item in items:
+        if 'network' in item.keywords:
+            item.add_marker(skip_network)
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Provide a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        yield Path(tmp_dir)
+    # pytest's tmp_path: no per-test TemporaryDirectory teardown, old runs pruned
+    return tmp_path
 
-@pytest.fixture
-def sample_video(temp_dir):
-    """Create a sample video file for testing."""
-    video_path = temp_dir / "sample.mp4"
+@pytest.fixture(scope='session')
+def sample_video(tmp_path_factory):
+    """Create a sample video file for testing (shared, treat as read-only)."""
+    video_path = tmp_path_factory.mktemp("video") / "sample.mp4"
     # Create a minimal valid MP4 file
     with open(video_path, 'wb') as f:
         f.write(bytes.fromhex('00000018667479706D703432'))
     return video_path
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+@pytest.fixture(scope='session')
+def encoded_video():
+    """Real 1s 1280x720 H.264/AAC clip checked into tests/fixtures (read-only)."""
+    # Regenerate with:
+    #   ffmpeg -f lavfi -i testsrc=duration=1:size=1280x720:rate=10 \
+    #     -f lavfi -i sine=frequency=1000:duration=1 -c:v libx264 -preset veryslow \
+    #     -crf 40 -pix_fmt yuv420p -c:a aac -b:a 32k -movflags +faststart sample.mp4
+    return FIXTURES_DIR / "sample.mp4"
+
 @pytest.fixture
-def sample_subtitle(temp_dir):
-    """Create a sample SRT subtitle file for testing."""
-    subtitle_path = temp_dir / "sample.srt"
+def encoded_video_copy(encoded_video, temp_dir):
+    """Writable per-test copy of the encoded sample video."""
+    return Path(shutil.copy(encoded_video, temp_dir / encoded_video.name))
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture(scope='session')
+def local_video_url(encoded_video):
+    """Serve the encoded sample video over HTTP on localhost."""
+    handler = partial(_QuietHandler, directory=str(encoded_video.parent))
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/{encoded_video.name}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+@pytest.fixture(scope='session')
+def sample_subtitle(tmp_path_factory):
+    """Create a sample SRT subtitle file for testing (shared, treat as read-only)."""
+    subtitle_path = tmp_path_factory.mktemp("subtitle") / "sample.srt"
     content = """1
 00:00:01,000 --> 00:00:04,000
 This is a sample subtitle
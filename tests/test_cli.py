@@ -61,4 +61,13 @@ class TestCLI:
         result = runner.invoke(download.download, 
             ['https://youtube.com/watch?v=bXERzEafjIU', option, value])
         assert result.exit_code == 0
-        mock_downloader.assert_called_once()
\ No newline at end of file
+        mock_downloader.assert_called_once()
+
+    @pytest.mark.cli
+    def test_invalid_rotation_rejected_before_download(self, runner, mock_downloader):
+        """Test that an unsupported --rotate value fails during parsing."""
+        result = runner.invoke(download.download,
+            ['https://youtube.com/watch?v=bXERzEafjIU', '--process', '--rotate', '45'])
+        assert result.exit_code == 2
+        assert "must be one of 0, 90, 180, 270" in result.output
+        mock_downloader.assert_not_called()
@@ -43,3 +43,17 @@ class TestSettings:
         print(f"After loading: {new_settings.get('download.max_concurrent_downloads')}")  # Log after loading
         assert new_settings.get('download.max_concurrent_downloads') == 5
 
+    @pytest.mark.config
+    def test_defaults_are_mutable_copies(self, temp_dir):
+        """Test that defaults can be changed and saved without a config file."""
+        config_file = temp_dir / 'missing.yaml'
+        settings = Settings(config_file=config_file)
+        assert settings.get('subtitles.languages') == ['en']
+        settings.config['download']['proxy'] = 'http://proxy:8080'
+        assert Settings(config_file=config_file).get('download.proxy') is None
+
+        settings.save()
+        with open(config_file) as f:
+            saved = yaml.safe_load(f)
+        assert saved['download']['proxy'] == 'http://proxy:8080'
+        assert saved['subtitles']['languages'] == ['en']
@@ -1,7 +1,9 @@
 # tests/test_downloader.py
+import hashlib
 import pytest
 from unittest.mock import Mock, patch
 from video_dl.core.downloader import VideoDownloader
+from video_dl.utils.filesystem import calculate_checksum
 from video_dl.models.config import DownloadConfig
 from video_dl.exceptions.errors import ValidationError
 
@@ -24,6 +26,16 @@ class TestVideoDownloader:
         assert downloader.config.quality == "720p"
         assert downloader.ydl_opts['ratelimit'] == 1024 * 1024  # 1M in bytes
 
+    def test_output_dir_created_once(self, temp_dir, valid_url):
+        """Test that configs sharing an output directory only create it once."""
+        output_path = temp_dir / "batch" / "videos"
+        DownloadConfig(url=valid_url, output_path=output_path)
+        assert output_path.is_dir()
+
+        with patch('pathlib.Path.mkdir') as mock_mkdir:
+            DownloadConfig(url=valid_url, output_path=output_path)
+            mock_mkdir.assert_not_called()
+
     @pytest.mark.parametrize("url", [
         "not_a_url",
         "http://",
@@ -61,6 +73,128 @@ class TestVideoDownloader:
         assert result.metadata.title == "Test Video"
         assert result.filepath == output_file
 
+    @pytest.mark.parametrize("compute_checksum", [False, True])
+    @patch('yt_dlp.YoutubeDL')
+    def test_checksum_is_opt_in(self, mock_ydl, compute_checksum, temp_dir, valid_url, mock_response):
+        """Test that the file checksum is only computed when requested."""
+        config = DownloadConfig(
+            url=valid_url,
+            output_path=temp_dir,
+            compute_checksum=compute_checksum
+        )
+
+        mock_ydl_instance = Mock()
+        mock_ydl_instance.extract_info.return_value = mock_response
+        output_file = temp_dir / "test_video.mp4"
+        mock_ydl_instance.prepare_filename.return_value = str(output_file)
+        mock_ydl.return_value.__enter__.return_value = mock_ydl_instance
+        output_file.write_bytes(b'dummy video content')
+
+        result = VideoDownloader(config).download()
+
+        assert result.success
+        if compute_checksum:
+            assert result.checksum == hashlib.sha256(b'dummy video content').hexdigest()
+        else:
+            assert result.checksum is None
+
+    @patch('video_dl.core.downloader.calculate_checksum')
+    @patch('yt_dlp.YoutubeDL')
+    def test_checksum_computed_while_downloading(self, mock_ydl, mock_checksum, temp_dir, valid_url, mock_response):
+        """Test that progress hooks hash the file as it is written."""
+        config = DownloadConfig(url=valid_url, output_path=temp_dir, format_id="22", compute_checksum=True)
+        downloader = VideoDownloader(config)
+        output_file = temp_dir / "test_video.mp4"
+        part_file = temp_dir / "test_video.mp4.part"
+        chunks = [b'a' * 1000, b'b' * 3000, b'c' * 500]
+
+        def fake_download(info, download):
+            written = 0
+            with open(part_file, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    f.flush()
+                    written += len(chunk)
+                    downloader._progress_hook({
+                        'status': 'downloading',
+                        'filename': str(output_file),
+                        'tmpfilename': str(part_file),
+                        'downloaded_bytes': written,
+                    })
+            part_file.rename(output_file)
+            downloader._progress_hook({'status': 'finished', 'filename': str(output_file)})
+            return mock_response
+
+        mock_ydl_instance = Mock()
+        mock_ydl_instance.extract_info.return_value = mock_response
+        mock_ydl_instance.process_ie_result.side_effect = fake_download
+        mock_ydl_instance.prepare_filename.return_value = str(output_file)
+        mock_ydl.return_value.__enter__.return_value = mock_ydl_instance
+
+        result = downloader.download()
+
+        assert result.success
+        assert result.checksum == hashlib.sha256(b''.join(chunks)).hexdigest()
+        mock_checksum.assert_not_called()
+
+    @patch('video_dl.core.downloader.calculate_checksum', wraps=calculate_checksum)
+    @patch('yt_dlp.YoutubeDL')
+    def test_checksum_of_merged_formats(self, mock_ydl, mock_checksum, temp_dir, valid_url, mock_response):
+        """Test that merged downloads hash only the merged file."""
+        config = DownloadConfig(url=valid_url, output_path=temp_dir, compute_checksum=True)
+        downloader = VideoDownloader(config)
+        output_file = temp_dir / "test_video.mp4"
+
+        def fake_download(info, download):
+            # yt-dlp downloads each part with the merged info updated by that
+            # part's format, minus 'requested_formats'
+            for format_id, ext in (('137', 'mp4'), ('140', 'm4a')):
+                part = temp_dir / f"test_video.f{format_id}.{ext}"
+                part_info = dict(info, format_id=format_id, ext=ext)
+                part.write_bytes(format_id.encode() * 100)
+                for status in ('downloading', 'finished'):
+                    downloader._progress_hook({
+                        'status': status,
+                        'filename': str(part),
+                        'downloaded_bytes': 300,
+                        'total_bytes': 300,
+                        'info_dict': part_info,
+                    })
+            output_file.write_bytes(b'merged video content')
+            return mock_response
+
+        mock_ydl_instance = Mock()
+        mock_ydl_instance.extract_info.return_value = mock_response
+        mock_ydl_instance.process_ie_result.side_effect = fake_download
+        mock_ydl_instance.prepare_filename.return_value = str(output_file)
+        mock_ydl.return_value.__enter__.return_value = mock_ydl_instance
+
+        with patch('video_dl.utils.filesystem.IncrementalChecksum.update_to') as mock_update:
+            result = downloader.download()
+
+        assert result.success
+        assert result.checksum == hashlib.sha256(b'merged video content').hexdigest()
+        mock_update.assert_not_called()
+        mock_checksum.assert_called_once_with(str(output_file), 'sha256')
+        assert downloader._checksums == {}
+
+    @patch('yt_dlp.YoutubeDL')
+    def test_download_many(self, mock_ydl, temp_dir, valid_url, mock_response):
+        """Test concurrent downloads return one result per URL, in order."""
+        urls = [valid_url, "https://www.youtube.com/watch?v=second"]
+        mock_ydl_instance = Mock()
+        mock_ydl_instance.extract_info.return_value = mock_response
+        mock_ydl_instance.prepare_filename.side_effect = lambda info: str(temp_dir / "test_video.mp4")
+        mock_ydl.return_value.__enter__.return_value = mock_ydl_instance
+        (temp_dir / "test_video.mp4").write_bytes(b'dummy video content')
+
+        downloader = VideoDownloader(DownloadConfig(url=valid_url, output_path=temp_dir))
+        results = downloader.download_many(urls, max_workers=2)
+
+        assert [r.success for r in results] == [True, True]
+        called_urls = sorted(c[0][0] for c in mock_ydl_instance.extract_info.call_args_list)
+        assert called_urls == sorted(urls)
+
     @patch('yt_dlp.YoutubeDL')
     def test_download_with_rate_limit(self, mock_ydl, temp_dir, valid_url):
         """Test download with rate limiting."""
@@ -72,6 +206,24 @@ class TestVideoDownloader:
         downloader = VideoDownloader(config)
         assert downloader.ydl_opts['ratelimit'] == 1024 * 1024  # 1M in bytes
 
+    @pytest.mark.parametrize("aria2c_path", [None, "/usr/bin/aria2c"])
+    def test_fragment_download_options(self, temp_dir, valid_url, aria2c_path):
+        """Test parallel fragment and aria2c downloader options."""
+        from video_dl.core import downloader as downloader_module
+        downloader_module._aria2c_available.cache_clear()
+        try:
+            with patch('video_dl.core.downloader.shutil.which', return_value=aria2c_path):
+                config = DownloadConfig(url=valid_url, output_path=temp_dir, fragment_workers=4)
+                opts = VideoDownloader(config).ydl_opts
+        finally:
+            downloader_module._aria2c_available.cache_clear()
+
+        assert opts['concurrent_fragment_downloads'] == 4
+        if aria2c_path:
+            assert opts['external_downloader'] == {'m3u8': 'aria2c', 'dash': 'aria2c'}
+        else:
+            assert 'external_downloader' not in opts
+
     @patch('yt_dlp.YoutubeDL')
     def test_retry_mechanism(self, mock_ydl, temp_dir, valid_url, mock_response):
         """Test download retry mechanism."""
@@ -95,6 +247,49 @@ class TestVideoDownloader:
         result = downloader.download()
         assert result.success
 
+    @patch('video_dl.core.downloader.time.sleep')
+    @patch('yt_dlp.YoutubeDL')
+    def test_retry_reuses_extracted_info(self, mock_ydl, mock_sleep, temp_dir, valid_url, mock_response):
+        """Test that a failed download is retried without extracting again."""
+        config = DownloadConfig(url=valid_url, output_path=temp_dir, retries=3)
+        downloader = VideoDownloader(config)
+
+        mock_instance = Mock()
+        mock_instance.extract_info.return_value = mock_response
+        mock_instance.process_ie_result.side_effect = [Exception("Connection reset"), mock_response]
+        output_file = temp_dir / "test_video.mp4"
+        mock_instance.prepare_filename.return_value = str(output_file)
+        output_file.touch()
+        mock_ydl.return_value.__enter__.return_value = mock_instance
+
+        result = downloader.download()
+
+        assert result.success
+        assert mock_instance.extract_info.call_count == 1
+        assert mock_instance.process_ie_result.call_count == 2
+        # Only the retry pays for a copy of the extracted info
+        first, retry = (c.args[0] for c in mock_instance.process_ie_result.call_args_list)
+        assert first is mock_response
+        assert retry is not mock_response and retry == mock_response
+
+    @patch('video_dl.core.downloader.time.sleep')
+    @patch('yt_dlp.YoutubeDL')
+    def test_permanent_errors_are_not_retried(self, mock_ydl, mock_sleep, temp_dir, valid_url):
+        """Test that errors like HTTP 404 fail without retrying."""
+        config = DownloadConfig(url=valid_url, output_path=temp_dir, retries=3)
+        downloader = VideoDownloader(config)
+
+        mock_instance = Mock()
+        mock_instance.extract_info.side_effect = Exception("ERROR: HTTP Error 404: Not Found")
+        mock_ydl.return_value.__enter__.return_value = mock_instance
+
+        result = downloader.download()
+
+        assert not result.success
+        assert "404" in result.error
+        assert mock_instance.extract_info.call_count == 1
+        mock_sleep.assert_not_called()
+
     @pytest.mark.parametrize("limit,expected", [
         ("1M", 1024 * 1024),        # 1M = 1,048,576 bytes
         ("500K", 500 * 1024),       # 500K = 512,000 bytes
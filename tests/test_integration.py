@@ -1,7 +1,6 @@
 # tests/test_integration.py
 import pytest
 from unittest.mock import patch, Mock
-import ffmpeg
 from video_dl.core.downloader import VideoDownloader
 from video_dl.core.processor import VideoProcessor
 from video_dl.models.config import DownloadConfig, ProcessingConfig
@@ -105,6 +104,7 @@ class TestIntegration:
         )
         
         # Create a proper ffmpeg.Error instance
+        import ffmpeg
         ffmpeg_error = ffmpeg.Error(
             cmd=['ffmpeg'],
             stdout=b'',
@@ -166,4 +166,4 @@ Test subtitle""")
             result = downloader.download()
 
             # Verify the downloaded URL is from the config
-            mock_instance.extract_info.assert_called_with(test_url, download=True)
\ No newline at end of file
+            mock_instance.extract_info.assert_called_with(test_url, download=False)
\ No newline at end of file
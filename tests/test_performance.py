@@ -1,39 +1,31 @@
 import pytest
 import time
-import subprocess
 from video_dl.models.config import DownloadConfig, ProcessingConfig
 from video_dl.core.downloader import VideoDownloader
 from video_dl.core.processor import VideoProcessor
 
 class TestPerformance:
     @pytest.fixture
-    def sample_video(self, temp_dir):  # Add temp_dir as a parameter
-        """Create a sample video for testing."""
-        video_path = temp_dir / "sample.mp4"
-        
-        # Create a test video using ffmpeg
-        try:
-            subprocess.run([
-                'ffmpeg',
-                '-f', 'lavfi',
-                '-i', 'testsrc=duration=1:size=1280x720:rate=30',
-                '-f', 'lavfi',
-                '-i', 'aevalsrc=0:duration=1',
-                '-c:v', 'libx264',
-                '-c:a', 'aac',
-                str(video_path)
-            ], check=True, capture_output=True)
-            
-            return video_path
-        except subprocess.CalledProcessError as e:
-            pytest.skip(f"Failed to create test video: {e.stderr.decode()}")
+    def sample_video(self, encoded_video_copy):
+        """Provide a writable copy of the session's sample video."""
+        return encoded_video_copy
+
+    @pytest.fixture
+    def download_url(self, request):
+        """Resolve 'local' to the sample video served from localhost."""
+        if request.param == 'local':
+            return request.getfixturevalue('local_video_url')
+        return request.param
 
     @pytest.mark.slow
-    def test_download_performance(self, temp_dir):
+    @pytest.mark.parametrize("download_url", [
+        'local',
+        pytest.param("https://www.youtube.com/watch?v=bXERzEafjIU", marks=pytest.mark.network),
+    ], indirect=True)
+    def test_download_performance(self, temp_dir, download_url):
         """Test download performance."""
-        test_url = "https://www.youtube.com/watch?v=bXERzEafjIU"
         config = DownloadConfig(
-            url=test_url,
+            url=download_url,
             output_path=temp_dir,
             quality='1080p'  # Set specific quality instead of 'best'
         )
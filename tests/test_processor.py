@@ -1,11 +1,18 @@
 # tests/test_processor.py
+import json
 import subprocess
 from unittest.mock import Mock, patch
+from video_dl.utils import ffmpeg as ffmpeg_utils
 from video_dl.core.processor import VideoProcessor
 from video_dl.models.config import ProcessingConfig
 from video_dl.exceptions.errors import ProcessingError
 import pytest
 
+@pytest.fixture(scope="module")
+def default_processor():
+    """One default-config processor shared by the stateless validation tests."""
+    return VideoProcessor(ProcessingConfig())
+
 class TestVideoProcessor:
     @pytest.fixture(autouse=True)
     def setup(self, tmp_path):
@@ -14,21 +21,9 @@ class TestVideoProcessor:
 
     @pytest.fixture
     def sample_video(self):
-        """Create a sample video for testing."""
+        """Create a placeholder video; these tests mock every ffmpeg call."""
         video_path = self.temp_dir / "test.mp4"
-        
-        # Create a test video using ffmpeg
-        subprocess.run([
-            'ffmpeg',
-            '-f', 'lavfi',
-            '-i', 'testsrc=duration=1:size=1280x720:rate=30',
-            '-f', 'lavfi',
-            '-i', 'aevalsrc=0:duration=1',
-            '-c:v', 'libx264',
-            '-c:a', 'aac',
-            str(video_path)
-        ], check=True, capture_output=True)
-        
+        video_path.touch()
         return video_path
     
     @pytest.fixture
@@ -46,7 +41,16 @@ class TestVideoProcessor:
         processor = VideoProcessor(sample_processing_config)
         assert processor.config == sample_processing_config
 
-    @patch('ffmpeg.probe')
+    @pytest.fixture
+    def mock_probe(self, monkeypatch):
+        """Stand in for the ffprobe subprocess; return_value is the parsed output."""
+        ffmpeg_utils._ffprobe_json.cache_clear()
+        probe = Mock()
+        def fake_run(args, **kwargs):
+            return subprocess.CompletedProcess(args, 0, stdout=json.dumps(probe()).encode())
+        monkeypatch.setattr(ffmpeg_utils.subprocess, 'run', fake_run)
+        return probe
+
     def test_video_info_extraction(self, mock_probe, temp_dir, sample_video):
         """Test extraction of video information."""
         mock_probe.return_value = {
@@ -67,32 +71,37 @@ class TestVideoProcessor:
         assert info['height'] == 1080
         assert info['fps'] == 30
         
+    def test_video_info_probe_reuse(self, mock_probe, sample_video):
+        """Test that probe results are cached and not shared between calls."""
+        mock_probe.return_value = {
+            'streams': [{'codec_type': 'video', 'width': 1280, 'height': 720, 'r_frame_rate': '30/1'}]
+        }
+        processor = VideoProcessor(ProcessingConfig())
+
+        processor._get_video_info(sample_video)['width'] = 0
+        assert processor._get_video_info(sample_video)['width'] == 1280
+        mock_probe.assert_called_once()
+        
     @pytest.mark.parametrize("crop_value,expected_error", [
         ("invalid", "Invalid crop format"),
         ("1280:720", "Invalid crop format"),
         ("1280:720:0", "Invalid crop format"),
         ("abc:def:0:0", "Invalid crop values"),
     ])
-    def test_invalid_crop_values(self, crop_value, expected_error):
+    def test_invalid_crop_values(self, default_processor, crop_value, expected_error):
         """Test handling of invalid crop values."""
-        config = ProcessingConfig()  # Create base config first
-        processor = VideoProcessor(config)
-        
         with pytest.raises(ProcessingError, match=expected_error):
-            processor._validate_crop(crop_value)
+            default_processor._validate_crop(crop_value)
 
     @pytest.mark.parametrize("resize_value,expected_error", [
         ("invalid", "Invalid resize format"),
         ("1280", "Invalid resize format"),
         ("axb", "Invalid resize values"),  # Changed from abc:def to axb to match format
     ])
-    def test_invalid_resize_values(self, resize_value, expected_error):
+    def test_invalid_resize_values(self, default_processor, resize_value, expected_error):
         """Test handling of invalid resize values."""
-        config = ProcessingConfig()
-        processor = VideoProcessor(config)
-        
         with pytest.raises(ProcessingError, match=expected_error):
-            processor._validate_resize(resize_value)
+            default_processor._validate_resize(resize_value)
 
     def test_processing_chain(self, sample_video):
         """Test multiple processing operations in sequence."""
@@ -116,17 +125,8 @@ class TestVideoProcessor:
             output = processor.process_video(sample_video)
             
             # Verify filter chain
-            crop_call = mock_stream.filter.call_args_list[0]
-            assert crop_call[0][0] == 'crop'
-            assert crop_call[0][1:] == (1280, 720, 0, 0)
-            
-            scale_call = mock_stream.filter.call_args_list[1]
-            assert scale_call[0][0] == 'scale'
-            assert scale_call[0][1:] == (640, 360)
-            
-            fps_call = mock_stream.filter.call_args_list[2]
-            assert fps_call[0][0] == 'fps'
-            assert fps_call[1] == {'fps': 30}
+            assert mock_output.call_args[1]['vf'] == 'crop=1280:720:0:0,scale=640:360,fps=fps=30'
+            mock_stream.filter.assert_not_called()
 
     def test_hdr_to_sdr_conversion(self, sample_video):
         """Test HDR to SDR conversion settings."""
@@ -145,17 +145,27 @@ class TestVideoProcessor:
             processor.process_video(sample_video)
             
             # Verify HDR to SDR filter chain
-            filter_calls = mock_stream.filter.call_args_list
-            
-            # Test each filter call individually
-            assert filter_calls[0][0][0] == 'zscale'
-            assert filter_calls[0][1] == {'t': 'linear', 'npl': 100}
-            
-            assert filter_calls[1][0][0] == 'format'
-            assert filter_calls[1][1] == {'pix_fmt': 'gbrp'}
-            
-            assert filter_calls[2][0][0] == 'zscale'
-            assert filter_calls[2][1] == {'p': 'bt709'}
+            assert mock_output.call_args[1]['vf'] == (
+                'zscale=t=linear:npl=100,format=gbrp,zscale=p=bt709,'
+                'tonemap=tonemap=hable,zscale=t=bt709:m=bt709:r=tv'
+            )
+
+    @pytest.mark.parametrize("hw_accel,video_codec,expected", [
+        ('cuda', 'libx264', 'h264_nvenc'),
+        ('qsv', 'libx265', 'hevc_qsv'),
+        ('videotoolbox', None, 'h264_videotoolbox'),
+        ('cuda', 'libvpx-vp9', 'libvpx-vp9'),
+    ])
+    def test_hardware_acceleration_args(self, hw_accel, video_codec, expected):
+        """Test hardware decoder and encoder selection."""
+        processor = VideoProcessor(ProcessingConfig(hw_accel=hw_accel, video_codec=video_codec))
+        assert processor._get_input_args() == {'hwaccel': hw_accel}
+        assert processor._get_output_args()['vcodec'] == expected
+
+    def test_invalid_hardware_acceleration(self):
+        """Test rejection of unknown hardware acceleration backends."""
+        with pytest.raises(ProcessingError, match="Unsupported hardware acceleration"):
+            VideoProcessor(ProcessingConfig(hw_accel='opengl'))
 
     @patch('video_dl.utils.ffmpeg.check_codec_support')
     def test_codec_validation(self, mock_check_codec, temp_dir):
@@ -185,4 +195,9 @@ class TestVideoProcessor:
         # Test when file exists
         output_path.touch()
         new_output_path = processor._get_output_path(input_path)
-        assert new_output_path.name == "test_processed_1.mp4"
\ No newline at end of file
+        assert new_output_path.name == "test_processed_1.mp4"
+        
+        # Test gaps are skipped past
+        (temp_dir / "test_processed_2.mp4").touch()
+        new_output_path.touch()
+        assert processor._get_output_path(input_path).name == "test_processed_3.mp4"
@@ -1,12 +1,17 @@
 # tests/test_subtitle.py
 import pytest
 from unittest.mock import Mock, patch
-import shutil
-import pysrt
+import re
 from video_dl.core.subtitle import SubtitleDownloader
 from video_dl.models.config import SubtitleConfig
 from video_dl.exceptions.errors import SubtitleError
 
+# First cue's "HH:MM:SS,mmm --> HH:MM:SS,mmm" line
+_TIMING_RE = re.compile(rb'(\d\d):(\d\d):(\d\d),(\d{3})\s*-->\s*(\d\d):(\d\d):(\d\d),(\d{3})')
+
+def _to_ms(h, m, s, ms):
+    return ((int(h) * 60 + int(m)) * 60 + int(s)) * 1000 + int(ms)
+
 class TestSubtitleDownloader:
     @pytest.fixture
     def sample_srt(self, temp_dir):
@@ -115,6 +120,39 @@ Second subtitle
         content = file_path.read_text(encoding='utf-8')
         assert "Test subtitle content" in content
 
+    def test_encoding_fix_late_non_ascii(self, temp_dir):
+        """Test that non-ASCII bytes past the detection sample are converted."""
+        head = b"1\n00:00:01,000 --> 00:00:02,000\nPlain ASCII line\n\n" * 2000
+        tail = "2\n00:00:03,000 --> 00:00:04,000\nLe café du théâtre, résumé élégant\n".encode('cp1252')
+        file_path = temp_dir / "late.srt"
+        file_path.write_bytes(head + tail)
+
+        config = SubtitleConfig(
+            url="https://youtube.com/watch?v=test",
+            output_path=temp_dir,
+            fix_encoding=True
+        )
+        SubtitleDownloader(config)._fix_encoding(file_path)
+
+        content = file_path.read_text(encoding='utf-8')
+        assert content.endswith("Le café du théâtre, résumé élégant\n")
+
+    def test_encoding_fix_low_confidence(self, temp_dir, monkeypatch):
+        """Test that a low-confidence guess is not taken as UTF-8 unchecked."""
+        monkeypatch.setattr('video_dl.core.subtitle._encoding_detector',
+                            lambda: lambda data: {'encoding': 'windows-1252', 'confidence': 0.5})
+        file_path = temp_dir / "guess.srt"
+        file_path.write_bytes("1\n00:00:01,000 --> 00:00:02,000\nCafé\n".encode('cp1252'))
+
+        config = SubtitleConfig(
+            url="https://youtube.com/watch?v=test",
+            output_path=temp_dir,
+            fix_encoding=True
+        )
+        with pytest.raises(UnicodeDecodeError):
+            SubtitleDownloader(config)._fix_encoding(file_path)
+        assert not (temp_dir / "guess.srt.tmp").exists()
+
     def test_format_conversion(self, temp_dir, sample_vtt):
         """Test conversion between subtitle formats."""
         config = SubtitleConfig(
@@ -157,6 +195,7 @@ Subtitle in {lang}"""
         content = result.read_text()
         assert 'Subtitle in en' in content
         assert 'Subtitle in es' in content
+        assert content == "\n\n".join(f.read_text() for f in files) + "\n\n"
 
     @pytest.mark.parametrize("time_offset", [-1.0, 1.0, 2.5])
     def test_time_adjustment(self, temp_dir, sample_srt, time_offset):
@@ -179,14 +218,12 @@ Subtitle in {lang}"""
         downloader._adjust_subtitle_timing(test_srt, time_offset)
         
         # Read and verify timing
-        subs = pysrt.open(str(test_srt))
+        timing = _TIMING_RE.search(test_srt.read_bytes())
+        assert timing, "No timing line found"
         
         # Calculate expected milliseconds
         expected_start_ms = max(0, 1000 + round(time_offset * 1000))  # Original 1 second + offset
-        actual_start_ms = (subs[0].start.hours * 3600000 + 
-                        subs[0].start.minutes * 60000 + 
-                        subs[0].start.seconds * 1000 + 
-                        subs[0].start.milliseconds)
+        actual_start_ms = _to_ms(*timing.groups()[:4])
         
         # Use small tolerance for floating-point arithmetic
         assert abs(actual_start_ms - expected_start_ms) <= 1, \
@@ -194,10 +231,7 @@ Subtitle in {lang}"""
         
         # Verify end time
         expected_end_ms = max(0, 4000 + round(time_offset * 1000))  # Original 4 seconds + offset
-        actual_end_ms = (subs[0].end.hours * 3600000 + 
-                        subs[0].end.minutes * 60000 + 
-                        subs[0].end.seconds * 1000 + 
-                        subs[0].end.milliseconds)
+        actual_end_ms = _to_ms(*timing.groups()[4:])
         
         assert abs(actual_end_ms - expected_end_ms) <= 1, \
             f"Expected {expected_end_ms}ms but got {actual_end_ms}ms"
@@ -211,11 +245,10 @@ Subtitle in {lang}"""
         )
         downloader = SubtitleDownloader(config)
 
-        test_file = temp_dir / "test_formatting.srt"
-        shutil.copy(sample_formatted_srt, test_file)
-        downloader._remove_formatting(test_file)
+        # The fixture file is per-test, so it's rewritten in place
+        downloader._remove_formatting(sample_formatted_srt)
 
-        content = test_file.read_text()
+        content = sample_formatted_srt.read_text()
         assert '<b>' not in content
         assert '<i>' not in content
         assert '{y:i}' not in content
@@ -278,18 +311,13 @@ Subtitle in {lang}"""
         result = downloader._convert_to_srt(invalid_vtt)
         assert result == invalid_vtt  # Should return original file on error
 
-    @pytest.mark.parametrize("format_list,expected_count", [
-        (['srt'], 1),
-        (['srt', 'vtt'], 2),
-        (['srt', 'vtt', 'ass'], 3)
-    ])
-    def test_multiple_format_download(self, format_list, expected_count, temp_dir):
+    def test_multiple_format_download(self, temp_dir):
         """Test downloading subtitles in multiple formats."""
-        config = SubtitleConfig(
-            url="https://youtube.com/watch?v=test",
-            output_path=temp_dir,
-            formats=format_list
-        )
+        cases = [
+            (['srt'], 1),
+            (['srt', 'vtt'], 2),
+            (['srt', 'vtt', 'ass'], 3),
+        ]
 
         with patch('yt_dlp.YoutubeDL') as mock_ydl:
             mock_instance = Mock()
@@ -297,20 +325,29 @@ Subtitle in {lang}"""
                 'title': 'Test Video',
                 'subtitles': {'en': [{'url': 'http://example.com/sub.vtt'}]}
             }
-            mock_instance.prepare_filename.return_value = str(temp_dir / "Test Video.mp4")
             mock_ydl.return_value.__enter__.return_value = mock_instance
 
-            # Simulate yt-dlp creating the subtitle files
-            for fmt in format_list:
-                subtitle_file = temp_dir / f"Test Video.en.{fmt}"
-                subtitle_content = f"WEBVTT\n\n00:00:01.000 --> 00:00:04.000\nTest subtitle in {fmt}"
-                subtitle_file.write_text(subtitle_content)
-
-            downloader = SubtitleDownloader(config)
-            result = downloader.download()
-
-            assert len(result) == expected_count
-            assert all(f.suffix[1:] in format_list for f in result)
+            for format_list, expected_count in cases:
+                # Each case gets its own directory so earlier files don't leak in
+                case_dir = temp_dir / "_".join(format_list)
+                config = SubtitleConfig(
+                    url="https://youtube.com/watch?v=test",
+                    output_path=case_dir,
+                    formats=format_list
+                )
+                mock_instance.prepare_filename.return_value = str(case_dir / "Test Video.mp4")
+
+                # Simulate yt-dlp creating the subtitle files
+                for fmt in format_list:
+                    subtitle_file = case_dir / f"Test Video.en.{fmt}"
+                    subtitle_content = f"WEBVTT\n\n00:00:01.000 --> 00:00:04.000\nTest subtitle in {fmt}"
+                    subtitle_file.write_text(subtitle_content)
+
+                downloader = SubtitleDownloader(config)
+                result = downloader.download()
+
+                assert len(result) == expected_count, format_list
+                assert all(f.suffix[1:] in format_list for f in result)
     
     def test_download_with_all_options(self, temp_dir, sample_vtt):
         """Test download with all processing options enabled."""
@@ -1,27 +1,17 @@
 # tests/test_utils.py
+import hashlib
+import os
 import pytest
-from video_dl.utils import ffmpeg, filesystem
+from video_dl.utils import ffmpeg, filesystem, validation
 import subprocess
 
+_FILLER = b"x" * 1000
+
 class TestFFmpegUtils:
     @pytest.fixture
-    def sample_video(self, temp_dir):
-        """Create a valid sample video file for testing."""
-        video_path = temp_dir / "sample.mp4"
-        
-        # Create a 1-second test video using ffmpeg
-        subprocess.run([
-            'ffmpeg',
-            '-f', 'lavfi',  # Use the lavfi input virtual device
-            '-i', 'testsrc=duration=1:size=1280x720:rate=30',  # Create test pattern
-            '-f', 'lavfi',
-            '-i', 'sine=frequency=1000:duration=1',  # Create test audio
-            '-c:v', 'libx264',
-            '-c:a', 'aac',
-            str(video_path)
-        ], capture_output=True)
-        
-        return video_path
+    def sample_video(self, encoded_video_copy):
+        """Provide a writable copy of the session's sample video."""
+        return encoded_video_copy
 
     @pytest.mark.utils
     def test_ffmpeg_installation(self):
@@ -34,6 +24,26 @@ class TestFFmpegUtils:
         assert ffmpeg.check_codec_support('libx264')
         assert not ffmpeg.check_codec_support('nonexistent_codec')
 
+    @pytest.mark.utils
+    def test_codec_support_parsing(self, monkeypatch):
+        """Test codec names are matched exactly and probed only once."""
+        output = (
+            " DEV.LS h264                 H.264 / AVC (decoders: h264 ) (encoders: libx264 h264_nvenc )\n"
+            " DEAIL. aac                  AAC (Advanced Audio Coding) (decoders: aac aac_fixed )\n"
+        )
+        calls = []
+        def fake_run(*args, **kwargs):
+            calls.append(args)
+            return subprocess.CompletedProcess(args, 0, stdout=output)
+        monkeypatch.setattr(ffmpeg, '_codecs', None)
+        monkeypatch.setattr(ffmpeg.subprocess, 'run', fake_run)
+
+        assert ffmpeg.check_codec_support('h264_nvenc')
+        assert ffmpeg.check_codec_support('aac')
+        assert not ffmpeg.check_codec_support('aac_at')
+        assert not ffmpeg.check_codec_support('AAC')
+        assert len(calls) == 1
+
     @pytest.mark.utils
     def test_video_info(self, sample_video):
         """Test video information extraction."""
@@ -53,6 +63,27 @@ class TestFFmpegUtils:
         audio_stream = next((s for s in info['streams'] if s['codec_type'] == 'audio'), None)
         assert audio_stream is not None
 
+    @pytest.mark.utils
+    def test_video_info_cached_until_file_changes(self, sample_video, monkeypatch):
+        """Test that unchanged files are probed once and results aren't shared."""
+        ffmpeg._ffprobe_json.cache_clear()
+        calls = []
+        real_run = subprocess.run
+        def counting_run(*args, **kwargs):
+            calls.append(args)
+            return real_run(*args, **kwargs)
+        monkeypatch.setattr(ffmpeg.subprocess, 'run', counting_run)
+
+        first = ffmpeg.get_video_info(sample_video)
+        first['streams'].clear()
+        assert ffmpeg.get_video_info(sample_video)['streams']
+        assert len(calls) == 1
+
+        with open(sample_video, 'ab') as f:
+            f.write(b'\0')
+        ffmpeg.get_video_info(sample_video)
+        assert len(calls) == 2
+
 class TestFilesystemUtils:
     @pytest.mark.utils
     def test_checksum(self, sample_video):
@@ -60,25 +91,133 @@ class TestFilesystemUtils:
         checksum = filesystem.calculate_checksum(sample_video)
         assert isinstance(checksum, str)
         assert len(checksum) == 64  # SHA-256 length
+        assert checksum == hashlib.sha256(sample_video.read_bytes()).hexdigest()
+
+    @pytest.mark.utils
+    @pytest.mark.parametrize("mmap_threshold", [0, 1 << 20])
+    def test_checksum_fallback_paths(self, temp_dir, monkeypatch, mmap_threshold):
+        """Test the chunked and memory-mapped paths used without file_digest."""
+        data_file = temp_dir / "data.bin"
+        data_file.write_bytes(bytes(range(256)) * 4096)
+        monkeypatch.delattr(hashlib, 'file_digest', raising=False)
+        monkeypatch.setattr(filesystem, '_CHECKSUM_MMAP_THRESHOLD', mmap_threshold)
+        checksum = filesystem.calculate_checksum(data_file, 'blake2b')
+        assert checksum == hashlib.blake2b(data_file.read_bytes()).hexdigest()
+
+    @pytest.mark.utils
+    def test_blake3_checksum(self, temp_dir):
+        """Test BLAKE3 checksums (optional dependency) on small and mapped files."""
+        blake3 = pytest.importorskip("blake3")
+        for size in (1024, 1 << 20):
+            data_file = temp_dir / f"data{size}.bin"
+            data_file.write_bytes(bytes(range(256)) * (size // 256))
+            checksum = filesystem.calculate_checksum(data_file, 'blake3')
+            assert len(checksum) == 64
+            assert checksum == blake3.blake3(data_file.read_bytes()).hexdigest()
+
+    @pytest.mark.utils
+    def test_incremental_checksum_matches(self, temp_dir):
+        """Test that hashing in steps matches hashing the whole file."""
+        data_file = temp_dir / "data.bin"
+        data_file.write_bytes(bytes(range(256)) * 16)
+        hasher = filesystem.IncrementalChecksum('md5')
+        hasher.update_to(str(data_file), 1000)
+        assert hasher.offset == 1000
+        hasher.update_to(str(data_file))
+        assert hasher.hexdigest() == filesystem.calculate_checksum(data_file, 'md5')
+
+    @pytest.mark.utils
+    @pytest.mark.parametrize("name,expected", [
+        ('Part 1/2: "Intro" | <HD>?*', 'Part 1_2_ _Intro_ _ _HD___'),
+        ('Café: Teil 1\\2', 'Café_ Teil 1_2'),
+        ('x' * 300, 'x' * 255),
+    ])
+    def test_clean_filename(self, name, expected):
+        """Test replacement of invalid characters for ASCII and non-ASCII names."""
+        assert filesystem.clean_filename(name) == expected
+
+    @pytest.mark.utils
+    def test_safe_move(self, temp_dir):
+        """Test moving files without overwriting an existing destination."""
+        dst = temp_dir / "out" / "video.mp4"
+        first, second = temp_dir / "first.mp4", temp_dir / "second.mp4"
+        first.write_text("first")
+        second.write_text("second")
+
+        assert filesystem.safe_move(first, dst) == dst
+        moved = filesystem.safe_move(second, dst)
+        assert moved != dst and moved.parent == dst.parent
+        assert moved.name.startswith("video_") and moved.suffix == ".mp4"
+        assert (dst.read_text(), moved.read_text()) == ("first", "second")
+        assert not first.exists() and not second.exists()
+
+    @pytest.mark.utils
+    def test_find_and_cleanup_files(self, temp_dir):
+        """Test scanning for files by pattern, optionally recursively."""
+        (temp_dir / "sub").mkdir()
+        for name in ("a.part", "b.mp4", "sub/c.part"):
+            (temp_dir / name).write_text("x")
+
+        assert set(filesystem.find_files(temp_dir, '*.part')) == {temp_dir / "a.part"}
+        assert set(filesystem.find_files(temp_dir, '*.part', recursive=True)) == {
+            temp_dir / "a.part", temp_dir / "sub" / "c.part"
+        }
+        assert list(filesystem.find_files(temp_dir / "missing")) == []
+
+        filesystem.cleanup_temp_files(temp_dir, '*.part')
+        assert sorted(p.name for p in temp_dir.iterdir()) == ["b.mp4", "sub"]
 
     @pytest.mark.utils
     def test_file_rotation(self, temp_dir):
         """Test file rotation functionality."""
-        # Create test files
+        # Create test files, file0 oldest
         for i in range(5):
-            (temp_dir / f"file{i}.txt").write_text("x" * 1000)
+            path = temp_dir / f"file{i}.txt"
+            path.write_bytes(_FILLER)
+            os.utime(path, (1_000_000 + i, 1_000_000 + i))
 
         rotator = filesystem.FileRotator(temp_dir, max_size=2000)
         rotator.rotate()
 
-        # Should have removed oldest files to get under max_size
-        files = list(temp_dir.glob("*.txt"))
-        total_size = sum(f.stat().st_size for f in files)
-        assert total_size <= 2000
+        # Should have removed the oldest files and kept the newest that fit
+        remaining = sorted(f.name for f in temp_dir.glob("*.txt"))
+        assert remaining == ["file3.txt", "file4.txt"]
+
+    @pytest.mark.utils
+    def test_file_rotation_counts_disk_usage(self, temp_dir):
+        """Test that sparse files are measured by allocated blocks."""
+        sparse = temp_dir / "sparse.mp4"
+        with open(sparse, 'wb') as f:
+            f.truncate(64 * 1024 * 1024)
+        st = sparse.stat()
+        if getattr(st, 'st_blocks', None) is None or st.st_blocks * 512 >= st.st_size:
+            pytest.skip("filesystem does not support sparse files")
+
+        filesystem.FileRotator(temp_dir, max_size=1024 * 1024).rotate()
+        assert sparse.exists()
 
     @pytest.mark.utils
     def test_empty_directory_cleanup(self, temp_dir):
         """Test cleanup with empty directory."""
         rotator = filesystem.FileRotator(temp_dir, max_size=1000)
         rotator.rotate()  # Should not raise any errors
-        assert list(temp_dir.glob("*")) == []
\ No newline at end of file
+        assert list(temp_dir.glob("*")) == []
+
+    @pytest.mark.utils
+    def test_rotation_missing_directory(self, temp_dir):
+        """Test rotation of a directory that does not exist."""
+        filesystem.FileRotator(temp_dir / "missing", max_size=1000).rotate()
+
+class TestValidationUtils:
+    @pytest.mark.utils
+    @pytest.mark.parametrize("url,expected", [
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", True),
+        ("rtmp://live.example.com/app", True),
+        ("http://", False),
+        ("www.youtube.com/watch", False),
+        ("not a url", False),
+        (None, False),
+    ])
+    def test_validate_url(self, url, expected):
+        """Test URL validation."""
+        assert validation.validate_url(url) is expected
\ No newline at end of file